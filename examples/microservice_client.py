@@ -119,9 +119,9 @@ class FumeHoodSashClient:
 
     def wait_for_movement_complete(self, timeout: int = 30, poll_interval: float = 1.0) -> bool:
         """Wait for current movement to complete."""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 if not self.is_moving():
                     return True
@@ -5,22 +5,41 @@ Demonstrates remote control via SSH with proper error handling.
 """
 
 import json
+import os
+import socket
 import subprocess
 import sys
+import tempfile
 import time
 
+import requests
+
 
 class FumeHoodSSHClient:
     def __init__(self, pi_ip, username='pi'):
         self.pi_ip = pi_ip
         self.username = username
-        self.base_url = "http://localhost:5000"
+        self.api_port = 5000  # API port on the Pi
+        # Share one multiplexed SSH connection across calls: the first command
+        # opens the master, later ones skip the TCP and key-exchange handshake.
+        self._control_path = os.path.join(
+            tempfile.gettempdir(), f"fumehood-{username}@{pi_ip}.sock"
+        )
+        self._ssh_opts = [
+            '-o', 'ControlMaster=auto',
+            '-o', f'ControlPath={self._control_path}',
+            '-o', 'ControlPersist=600',
+        ]
+        # API calls go over HTTP through a local port forwarded on that same
+        # connection, reusing one keep-alive session instead of remote curl.
+        self._api_url = None
+        self._session = requests.Session()
 
     def _ssh_command(self, command):
         """Execute a command via SSH and return the result."""
         try:
             result = subprocess.run(
-                ['ssh', f'{self.username}@{self.pi_ip}', command],
+                ['ssh', *self._ssh_opts, f'{self.username}@{self.pi_ip}', command],
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -35,28 +54,49 @@ class FumeHoodSSHClient:
         except Exception as e:
             raise Exception(f"SSH error: {e}")
 
+    def _ensure_tunnel(self, attempts=3):
+        """Forward a free local port to the Pi's API over the shared SSH connection."""
+        if self._api_url is not None:
+            return
+
+        self._ssh_command('true')  # bring the master connection up
+        for _ in range(attempts):
+            # The probe socket is released before ssh binds the port, so
+            # another process can take it in between; pick again if so.
+            with socket.socket() as s:
+                s.bind(('127.0.0.1', 0))
+                local_port = s.getsockname()[1]
+
+            result = subprocess.run(
+                ['ssh', '-o', f'ControlPath={self._control_path}', '-O', 'forward',
+                 '-L', f'{local_port}:localhost:{self.api_port}',
+                 f'{self.username}@{self.pi_ip}'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                self._api_url = f"http://127.0.0.1:{local_port}"
+                return
+        raise Exception(f"SSH port forward failed: {result.stderr}")
+
     def _api_call(self, endpoint, method='GET', data=None):
-        """Make an API call via SSH."""
-        if method == 'GET':
-            command = f"curl -s {self.base_url}{endpoint}"
-        elif method == 'POST':
-            if data:
-                json_data = json.dumps(data).replace('"', '\\"')
-                command = (
-                    f"curl -X POST {self.base_url}{endpoint} "
-                    f"-H 'Content-Type: application/json' -d \"{json_data}\""
-                )
-            else:
-                command = f"curl -X POST {self.base_url}{endpoint}"
-        else:
+        """Make an API call through the SSH tunnel."""
+        if method not in ('GET', 'POST'):
             raise ValueError(f"Unsupported method: {method}")
 
-        response = self._ssh_command(command)
+        self._ensure_tunnel()
+        try:
+            response = self._session.request(
+                method, f"{self._api_url}{endpoint}", json=data, timeout=10
+            )
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API request failed: {e}")
 
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            raise Exception(f"Invalid JSON response: {response}")
+            return response.json()
+        except ValueError:
+            raise Exception(f"Invalid JSON response: {response.text}")
 
     def get_status(self):
         """Get current system status."""
@@ -79,9 +119,9 @@ class FumeHoodSSHClient:
 
     def wait_for_movement_complete(self, timeout=30):
         """Wait for current movement to complete."""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 status = self.get_status()
                 if not status.get('is_moving', False):
@@ -121,6 +161,17 @@ class FumeHoodSSHClient:
         command = "sudo systemctl restart actuator.service"
         return self._ssh_command(command)
 
+    def close(self):
+        """Close the HTTP session and the shared SSH master (and its tunnel)."""
+        self._session.close()
+        self._api_url = None
+        subprocess.run(
+            ['ssh', '-o', f'ControlPath={self._control_path}', '-O', 'exit',
+             f'{self.username}@{self.pi_ip}'],
+            capture_output=True,
+            timeout=10
+        )
+
     def check_service_status(self):
         """Check if the service is running."""
         command = "systemctl is-active actuator.service"
@@ -143,9 +194,8 @@ def main():
     pi_ip = sys.argv[1]
     command = sys.argv[2] if len(sys.argv) > 2 else 'status'
 
+    client = FumeHoodSSHClient(pi_ip)
     try:
-        client = FumeHoodSSHClient(pi_ip)
-
         if command == 'status':
             status = client.get_status()
             print(f"Status: {json.dumps(status, indent=2)}")
@@ -184,6 +234,9 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        # Drop the port forward and the persisted master with this run.
+        client.close()
 
 
 if __name__ == '__main__':
@@ -2,7 +2,6 @@
 
 import RPi.GPIO as GPIO
 import threading
-import time
 
 class PhysicalButtons(threading.Thread):
     def __init__(self, actuator, up_pin, down_pin, stop_pin=None, bounce_time=300):
@@ -12,6 +11,7 @@ class PhysicalButtons(threading.Thread):
         self.down_pin = down_pin
         self.stop_pin = stop_pin
         self.bounce_time = bounce_time
+        self._stopped = threading.Event()
 
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.up_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
@@ -20,20 +20,24 @@ class PhysicalButtons(threading.Thread):
             GPIO.setup(self.stop_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
     def run(self):
-        while True:
-            if GPIO.input(self.up_pin) == GPIO.LOW:
-                self.handle_up_press()
-                time.sleep(self.bounce_time / 1000)
-
-            if GPIO.input(self.down_pin) == GPIO.LOW:
-                self.handle_down_press()
-                time.sleep(self.bounce_time / 1000)
-
-            if self.stop_pin and GPIO.input(self.stop_pin) == GPIO.LOW:
-                self.handle_stop_press()
-                time.sleep(self.bounce_time / 1000)
-
-            time.sleep(0.1)
+        # Presses arrive as falling-edge callbacks, debounced by the GPIO
+        # library, so this thread only has to keep them registered.
+        handlers = {self.up_pin: self.handle_up_press, self.down_pin: self.handle_down_press}
+        if self.stop_pin:
+            handlers[self.stop_pin] = self.handle_stop_press
+        for pin, handler in handlers.items():
+            GPIO.add_event_detect(pin, GPIO.FALLING,
+                                  callback=lambda channel, handler=handler: handler(),
+                                  bouncetime=self.bounce_time)
+        self._stopped.wait()
+        for pin in handlers:
+            GPIO.remove_event_detect(pin)
+
+    def close(self):
+        """Stop listening for presses; returns once the edge callbacks are removed."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
 
     def handle_up_press(self):
         print("Up button pressed")
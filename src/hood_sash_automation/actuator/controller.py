@@ -2,7 +2,9 @@
 import time
 import threading
 import logging
+import logging.handlers
 import os
+import queue
 import datetime
 
 from .switches import HallArray
@@ -10,89 +12,188 @@ from .relay import ActuatorRelay
 from .current import CurrentSensor
 from .lcd_display_DFR0997 import DFRobotLCD
 
+log = logging.getLogger(__name__)
+
+POSITIONS = range(1, 6)
+IMAGE_DIR = "/home/pi/sash/images"
+# (start, target) -> bitmask with bit p set for every position passed on the
+# way, start and target excluded. Direction follows from start < target.
+_EXPECTED_MASKS = {
+    (s, t): sum(1 << p for p in (range(s + 1, t) if s < t else range(t + 1, s)))
+    for s in POSITIONS for t in POSITIONS if s != t
+}
+
 class SashActuator:
     def __init__(self, config):
         self.config = config
 
         # Setup logging
+        self._log_listener = None
         self._setup_logging()
 
-        # Initialize hardware components
+        # Initialize hardware components. The LCD goes first so its firmware
+        # boot delay overlaps the rest of the setup before begin() waits on it.
+        self.lcd = DFRobotLCD()
         self.relay = ActuatorRelay(config['RELAY_EXT'], config['RELAY_RET'])
         self.sensor = CurrentSensor(address=config['INA_ADDR'], busnum=config['I2C_BUS'],
-                                    r_shunt=config['R_SHUNT'], i_max=config['I_MAX'])
+                                    r_shunt=config['R_SHUNT'], i_max=config['I_MAX'],
+                                    alpha=config.get('CURRENT_FILTER_ALPHA', 0.3),
+                                    avg_samples=config.get('CURRENT_AVG_SAMPLES', 1))
         self.hall = HallArray(config['HALL_PINS'], bouncetime=config['BOUNCE_MS'])
-        self.lcd = DFRobotLCD()
         self.lcd.begin()
         self.lcd.clean_screen()
 
-        logging.info(f"Calibration register: 0x{self.sensor.cal_value_read():04X}")
+        log.info("Calibration register: 0x%04X", self.sensor.cal_value_read())
+
+        # Per-sensor edge messages, built once so hall_callback only indexes.
+        hall_range = range(len(config['HALL_PINS']))
+        self._reached_msgs = tuple(
+            f"Position {i + 1} reached (Hall sensor {i})" for i in hall_range
+        )
+        self._left_msgs = tuple(f"Left position {i + 1} (Hall sensor {i})" for i in hall_range)
+        # Map each packed snapshot with exactly one active-low pin straight to
+        # its position. Any other pattern (none or several magnets) is no position.
+        hall_mask = sum(1 << pin for pin in config['HALL_PINS'])
+        self._position_lut = {
+            hall_mask & ~(1 << pin): i + 1 for i, pin in enumerate(config['HALL_PINS'])
+        }
 
         self.current_position = self.get_current_position()
+        # hall_callback bumps _position_seq and notifies whenever a magnet is
+        # detected, so movement loops wake on the edge instead of polling.
+        self._position_cond = threading.Condition()
+        self._position_seq = 0
+        # Bit p set once position p has been seen; _supervise resets it per move.
+        self._reached_mask = 0
+        # Current is read on its own thread so collision detection does not
+        # share a cadence with the Hall/validation loop. It only touches the
+        # bus while _supervise has _sampling set, and raises collision_event.
+        self._sampling = threading.Event()
+        self._collision_thresholds = {"up": config['CURRENT_THRESHOLD_UP'],
+                                      "down": config['CURRENT_THRESHOLD_DOWN']}
+        self._sample_direction = None
+        self.collision_event = threading.Event()
+        self._sampler_thread = threading.Thread(target=self._current_sampler, daemon=True)
+        self._sampler_thread.start()
         self.hall.set_callback(self.hall_callback)
         self.stop_flag = threading.Event()
-        self.movement_thread = None
         self.equipment_status = "ready"
         self.target_position = None
 
         self.display_mode = 'position' # Default display mode
+        self._last_position_state = None  # last text written to POSITION_STATE_FILE
+
+        # One long-lived worker runs every move. _idle is cleared from the
+        # moment a move is accepted until the worker has finished it.
+        self._move_lock = threading.Lock()
+        self._move_queue = queue.Queue(maxsize=1)
+        self._idle = threading.Event()
+        self._idle.set()
+        self.movement_thread = threading.Thread(target=self._movement_worker, daemon=True)
+        self.movement_thread.start()
+
+        # LCD updates are slow I2C writes, so a worker does them. The queue
+        # holds one pending image; a newer request replaces a stale one.
+        self._lcd_queue = queue.Queue(maxsize=1)
+        self.reload_images()
+        self._lcd_thread = threading.Thread(target=self._lcd_worker, daemon=True)
+        self._lcd_thread.start()
+
+        # The position state file is written off the movement thread. Only
+        # the newest position matters, so the writer skips stale entries.
+        self._state_queue = queue.Queue()
+        self._state_thread = threading.Thread(target=self._state_writer, daemon=True)
+        self._state_thread.start()
 
         if self.config.get('HOME_ON_STARTUP', False):
             self.home_on_startup()
 
 
     def _setup_logging(self):
+        root = logging.getLogger()
+        if root.handlers:
+            # Logging is already set up, by the host process or an earlier
+            # controller; basicConfig would ignore ours, so don't build them.
+            return
         LOG_DIR = self.config.get("LOG_DIR", "/var/log/sash_actuator")
         os.makedirs(LOG_DIR, exist_ok=True)
         SESSION_TIMESTAMP = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         LOG_FILE = os.path.join(LOG_DIR, f"session_{SESSION_TIMESTAMP}.log")
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[
-                logging.FileHandler(LOG_FILE),
-                logging.StreamHandler()
-            ]
-        )
+        # The movement and Hall threads only enqueue records; file and console
+        # I/O happen on the listener thread so they never stall the hot loop.
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        self._log_handler = logging.handlers.QueueHandler(log_queue)
+        logging.basicConfig(level=logging.INFO, handlers=[self._log_handler])
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+
+    def _stop_logging(self):
+        """Detach the queue handler and stop the listener _setup_logging started."""
+        if self._log_listener is None:
+            return
+        logging.getLogger().removeHandler(self._log_handler)
+        self._log_listener.stop()  # flushes queued records
+        for handler in self._log_listener.handlers:
+            handler.close()
+        self._log_listener = None
 
     def hall_callback(self, ch, state, idx):
         if state == 0:  # Magnet detected
-            self.current_position = idx + 1
-            logging.info(f"Position {self.current_position} reached (Hall sensor {idx})")
+            with self._position_cond:
+                self.current_position = idx + 1
+                self._reached_mask |= 1 << self.current_position
+                self._position_seq += 1
+                self._position_cond.notify_all()
+            log.info(self._reached_msgs[idx])
             if self.display_mode is not None:
                 self.display_image(self.current_position, self.display_mode)
         else:
-            logging.info(f"Left position {idx + 1} (Hall sensor {idx})")
+            log.info(self._left_msgs[idx])
             self.current_position = self.get_current_position()
 
     def get_current_position(self):
-        states = self.hall.snapshot()
-        for idx, state in enumerate(states):
-            if state == 0:
-                self.current_position = idx + 1
-                return self.current_position
-        self.current_position = None
+        self.current_position = self._position_lut.get(self.hall.snapshot_bits())
         return self.current_position
 
     def move_to_position_async(self, target_pos, mode=None):
-        if self.movement_thread and self.movement_thread.is_alive():
-            logging.warning("Movement already in progress.")
-            return False
-
         if mode is None:
             mode = self.display_mode
 
-        self.stop_flag.clear()
-        self.equipment_status = "moving"
-        self.target_position = target_pos
-        self.movement_thread = threading.Thread(target=self.move_to_position, args=(target_pos, mode))
-        self.movement_thread.start()
+        with self._move_lock:
+            if not self._idle.is_set():
+                log.warning("Movement already in progress.")
+                return False
+            self._idle.clear()
+            self.stop_flag.clear()
+            self.equipment_status = "moving"
+            self.target_position = target_pos
+            self._move_queue.put_nowait((target_pos, mode))
         return True
 
+    def _movement_worker(self):
+        while True:
+            item = self._move_queue.get()
+            if item is None:  # shutdown sentinel from clean_exit
+                return
+            target_pos, mode = item
+            try:
+                self.move_to_position(target_pos, mode)
+            except Exception:
+                log.exception("Movement failed.")
+                self.relay.all_off()
+                self.equipment_status = "ready"
+                self.target_position = None
+            finally:
+                self._idle.set()
+
     def move_to_position(self, target_pos, mode):
-        logging.info(f"Attempting to move actuator to position {target_pos} in mode {mode}")
-        if not 1 <= target_pos <= 5:
-            logging.error(f"Invalid position {target_pos}. Use positions 1-5.")
+        log.info("Attempting to move actuator to position %s in mode %s", target_pos, mode)
+        if target_pos not in POSITIONS:
+            log.error("Invalid position %s. Use positions 1-5.", target_pos)
             self.equipment_status = "ready"
             self.target_position = None
             return
@@ -100,66 +201,46 @@ class SashActuator:
         current_pos = self.get_current_position()
 
         if current_pos == target_pos:
-            logging.info(f"Already at position {target_pos}")
+            log.info("Already at position %s", target_pos)
             self.equipment_status = "ready"
             self.target_position = None
             return
 
         if current_pos is None:
-            logging.info("Position unknown - searching with downward pulses...")
-            for pulse in range(5):
+            log.info("Position unknown - searching downward...")
+            current_pos = self._search_down()
+            if current_pos is None:
+                self.target_position = None
                 if self.stop_flag.is_set():
-                    logging.info("Stop requested during position search.")
-                    self.relay.all_off()
+                    log.info("Stop requested during position search.")
                     self.equipment_status = "stopped"
-                    self.target_position = None
-                    return
-                logging.info(f"Pulse {pulse + 1}/5...")
-                self._pulse_down()
-                current_pos = self.current_position
-                if current_pos is not None:
-                    logging.info(f"Found position {current_pos}")
-                    time.sleep(0.1)
-                    break
-            else:
-                logging.error("Could not determine position after 5 pulses")
-                self.equipment_status = "ready"
-                self.target_position = None
+                else:
+                    log.error("Could not determine position during search")
+                    self.equipment_status = "ready"
                 return
+            log.info("Found position %s", current_pos)
+            self.stop_flag.wait(0.1)
 
+        self._begin_run(current_pos)
         if current_pos < target_pos:
-            logging.info(f"Moving UP from position {current_pos} to position {target_pos}")
+            log.info("Moving UP from position %s to position %s", current_pos, target_pos)
             direction = "up"
             self.relay.up_on()
         else:
-            logging.info(f"Moving DOWN from position {current_pos} to position {target_pos}")
+            log.info("Moving DOWN from position %s to position %s", current_pos, target_pos)
             direction = "down"
             self.relay.down_on()
 
-        time.sleep(0.5) # delay to skip initial current spike
+        self._skip_inrush()
 
-        start_time = time.time()
-        last_valid_time = start_time
-        last_valid_pos = current_pos
-
-        while self.current_position != target_pos:
-            if self.stop_flag.is_set():
-                logging.info("Stop requested during movement.")
-                break
-
-            if time.time() - start_time > self.config['MAX_MOVEMENT_TIME']:
-                logging.error("Movement timed out.")
-                break
-
-            if not self._check_movement_current(direction):
-                logging.warning("Collision detected based on current.")
-                break
-
-            last_valid_time, last_valid_pos = self._validate_movement_sequence(
-                current_pos, target_pos, direction, last_valid_time, last_valid_pos
-            )
-
-            time.sleep(0.01)
+        outcome = self._supervise(direction, self.config['MAX_MOVEMENT_TIME'],
+                                  current_pos, target_pos)
+        if outcome == "stopped":
+            log.info("Stop requested during movement.")
+        elif outcome == "timeout":
+            log.error("Movement timed out.")
+        elif outcome == "collision":
+            log.warning("Collision detected based on current.")
 
         self.relay.all_off()
         if self.stop_flag.is_set():
@@ -167,96 +248,299 @@ class SashActuator:
         else:
             self.equipment_status = "ready"
         self.target_position = None
-        logging.info(f"Movement finished. Final position: {self.current_position}")
+        log.info("Movement finished. Final position: %s", self.current_position)
         self._write_position_state()
 
 
+    def _supervise(self, direction, duration, start_pos=None, target_pos=None):
+        """
+        Hot loop while the relay is driving, shared by moves and the search.
+
+        With a target_pos it runs until that position is reached, validating
+        the Hall sequence on the way; without one (the position search) it
+        runs until any position is seen. Either way it also ends on stop,
+        after `duration` seconds, or when the current sampler flags a collision.
+        Returns "reached", "stopped", "timeout" or "collision". The caller
+        owns relay setup, teardown and logging of the outcome.
+        """
+        moving = target_pos is not None
+        if moving:
+            expected_mask = _EXPECTED_MASKS[start_pos, target_pos]
+
+        # Loop invariants bound once; the body runs on every wakeup.
+        now = time.monotonic_ns
+        stop_requested = self.stop_flag.is_set
+        collision = self.collision_event.is_set
+        validate = self._validate_movement_sequence
+        pop_events = self.hall.pop_events
+        position_cond = self._position_cond
+        position_timeout_ns = int(self.config['POSITION_TIMEOUT'] * 1e9)
+
+        with position_cond:
+            seen_seq = self._position_seq
+        start_time = now()
+        deadline = start_time + int(duration * 1e9)
+        last_valid_time = start_time
+        last_valid_pos = start_pos
+        edge = True  # replay anything queued since _begin_run, e.g. during inrush
+
+        self._sample_direction = direction
+        self.sensor.reset_filter()
+        self.collision_event.clear()
+        self._sampling.set()
+        try:
+            while True:
+                pos = self.current_position
+                if moving:
+                    if pos == target_pos:
+                        missed_mask = expected_mask & ~self._reached_mask
+                        if missed_mask:
+                            missed = [p for p in POSITIONS if (missed_mask >> p) & 1]
+                            log.warning("Position(s) %s not detected between %s and %s",
+                                        missed, start_pos, target_pos)
+                        return "reached"
+                elif pos is not None:
+                    return "reached"
+
+                if stop_requested():
+                    return "stopped"
+                if collision():
+                    return "collision"
+
+                t = now()
+                if t > deadline:
+                    return "timeout"
+
+                # The sequence only changes on a Hall edge: replay queued arrivals
+                # in order with their sample times. Between edges just watch for
+                # the no-position timeout.
+                wake = deadline
+                if moving:
+                    if edge:
+                        for idx, level, event_t in pop_events():
+                            if level == 0:
+                                last_valid_time, last_valid_pos = validate(
+                                    target_pos, direction, last_valid_time,
+                                    last_valid_pos, int(event_t * 1e9), idx + 1
+                                )
+                    elif t - last_valid_time > position_timeout_ns:
+                        last_valid_time, last_valid_pos = validate(
+                            target_pos, direction, last_valid_time,
+                            last_valid_pos, t, self.current_position
+                        )
+                    wake = min(wake, last_valid_time + position_timeout_ns + 1)
+
+                # Sleep until a Hall edge, stop() or the sampler wakes us, or a timeout is due.
+                with position_cond:
+                    if self._position_seq == seen_seq and not stop_requested() and not collision():
+                        position_cond.wait(max(wake - now(), 0) / 1e9)
+                    edge = self._position_seq != seen_seq
+                    seen_seq = self._position_seq
+        finally:
+            self._sampling.clear()
+
+    def _current_sampler(self):
+        """
+        Read the INA219 every CURRENT_SAMPLE_INTERVAL while _supervise is
+        driving and raise collision_event on overcurrent. Runs SCHED_FIFO
+        when the service is allowed to (CAP_SYS_NICE); otherwise it stays
+        at normal priority.
+        """
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (AttributeError, OSError) as e:
+            log.info("Current sampler running at normal priority: %s", e)
+        # Paced on a monotonic ns schedule so the rate does not drift with
+        # read time; loop invariants are bound once.
+        now = time.monotonic_ns
+        sleep = time.sleep
+        sampling = self._sampling
+        collision = self.collision_event
+        check_current = self._check_movement_current
+        # No faster than the INA219 produces new conversions: a quicker read
+        # would only fetch the same value again over the bus.
+        conversion_time = self.sensor.conversion_time
+        interval = max(self.config.get('CURRENT_SAMPLE_INTERVAL', 0.002), conversion_time)
+        interval_ns = int(interval * 1e9)
+        next_sample = now()
+        while True:
+            if not sampling.is_set():
+                sampling.wait()
+                next_sample = now()
+            if not collision.is_set():
+                try:
+                    ok = check_current(self._sample_direction)
+                except Exception:
+                    log.exception("Current sensor read failed; stopping movement.")
+                    ok = False
+                if not ok:
+                    collision.set()
+                    with self._position_cond:
+                        self._position_cond.notify_all()
+            next_sample += interval_ns
+            delay = next_sample - now()
+            if delay > 0:
+                sleep(delay / 1e9)
+            else:
+                next_sample = now()  # fell behind; don't burst to catch up
+
     def stop(self):
         self.stop_flag.set()
-        if self.movement_thread and self.movement_thread.is_alive():
-            self.movement_thread.join()
+        with self._position_cond:
+            self._position_cond.notify_all()  # wake a movement loop blocked on its wait
+        if self.movement_thread.is_alive():
+            self._idle.wait()
         self.relay.all_off()
         self.equipment_status = "stopped"
         self.target_position = None
-        logging.info("Movement stopped by user.")
+        log.info("Movement stopped by user.")
 
     def home_on_startup(self, mode=None):
         if mode is None:
             mode = self.display_mode
 
-        logging.info("Homing actuator on startup...")
+        log.info("Homing actuator on startup...")
         self.move_to_position_async(1, mode) # Move to position 1 (home)
 
     def clean_exit(self):
-        logging.info("Cleaning up resources.")
+        log.info("Cleaning up resources.")
+        self.relay.all_off()  # de-energise the motor before anything that can block
         self.stop()
+        # Let both workers finish on a sentinel, so nothing is mid-move or
+        # mid-draw when the Hall poller and the LCD are released below.
+        if self.movement_thread.is_alive():
+            self._move_queue.put(None)
+            self.movement_thread.join(timeout=1)
+        if self._lcd_thread.is_alive():
+            self._post_lcd(None)
+            self._lcd_thread.join(timeout=1)
+        if self._state_thread.is_alive():
+            self._state_queue.put(None)  # after the last queued position
+            self._state_thread.join(timeout=1)
         self.hall.close()
         self.lcd.clean_screen()
-
-    def _pulse_down(self):
+        self.sensor.close()
+        self.relay.close()
+        self._stop_logging()
+
+    def _search_down(self):
+        """
+        Drive down in one continuous run until any Hall sensor fires.
+        Returns the position found, or None on stop, collision or timeout.
+        """
+        self._begin_run()
         self.relay.down_on()
-        time.sleep(1)
-        start_time = time.time()
-        initial_position = self.current_position
-        while time.time() - start_time < 1.0:
-            if not self._check_movement_current("down"):
-                self.relay.all_off()
-                return False
-            if self.current_position is not None and self.current_position != initial_position:
-                self.relay.all_off()
-                return True
-            time.sleep(0.01)
+        self._skip_inrush()
+        outcome = self._supervise("down", self.config['MAX_MOVEMENT_TIME'])
         self.relay.all_off()
-        time.sleep(0.2)
-        return True
+        if outcome == "collision":
+            log.warning("Collision detected based on current.")
+        return self.current_position if outcome == "reached" else None
+
+    def _begin_run(self, start_pos=None):
+        """
+        Forget Hall history from before this run. Called before the relay is
+        energised, so edges seen during the inrush delay still count.
+        """
+        self.hall.pop_events()
+        with self._position_cond:
+            self._reached_mask = 0 if start_pos is None else 1 << start_pos
+
+    def _skip_inrush(self):
+        # Don't watch current through the motor's start-up spike. Waiting on
+        # stop_flag rather than sleeping lets stop() cut the delay short.
+        self.stop_flag.wait(self.config.get('INRUSH_SKIP_TIME', 0.5))
 
     def _check_movement_current(self, direction):
-        amps = self.sensor.read_raw_shunt()
-        if direction == "up" and amps > self.config['CURRENT_THRESHOLD_UP']:
-            logging.warning(f"Collision current detected during upward movement: {amps}")
-            return False
-        elif direction == "down" and amps < self.config['CURRENT_THRESHOLD_DOWN']:
-            logging.warning(f"Collision current detected during downward movement: {amps}")
+        # Compare the low-passed shunt counts, so a single noisy sample neither
+        # trips the check nor hides a sustained spike.
+        amps = self.sensor.read_filtered()
+        threshold = self._collision_thresholds[direction]
+        if amps > threshold if direction == "up" else amps < threshold:
+            log.warning("Collision current detected during %sward movement: %.0f", direction, amps)
             return False
         return True
 
-    def _validate_movement_sequence(self, start_pos, target_pos, direction, last_valid_time, last_valid_pos):
-        current_time = time.time()
-        current_pos = self.get_current_position()
+    def _validate_movement_sequence(self, target_pos, direction,
+                                    last_valid_time, last_valid_pos, current_time, current_pos):
+        """
+        Check current_pos, seen at current_time, against the expected sequence.
+        Times are in ns.
+        """
+        position_timeout = self.config['POSITION_TIMEOUT']
 
-        if current_time - last_valid_time > self.config['POSITION_TIMEOUT']:
-            logging.warning(f"No position detected for {self.config['POSITION_TIMEOUT']} seconds.")
+        if current_time - last_valid_time > int(position_timeout * 1e9):
+            log.warning("No position detected for %s seconds.", position_timeout)
             return current_time, last_valid_pos
 
         if current_pos is not None:
+            # last_valid_pos starts at start_pos and only moves toward the
+            # target, so one chained comparison bounds the expected window.
             if direction == "up":
-                expected_positions = range(start_pos + 1, target_pos + 1)
-                if current_pos in expected_positions and current_pos > last_valid_pos:
-                     if current_pos != start_pos + 1 and current_pos != last_valid_pos + 1:
-                        logging.warning(f"Missed position(s) between {last_valid_pos} and {current_pos}")
-                     return current_time, current_pos
+                advanced = last_valid_pos < current_pos <= target_pos
+                step = last_valid_pos + 1
             else: # down
-                expected_positions = range(start_pos - 1, target_pos - 1, -1)
-                if current_pos in expected_positions and current_pos < last_valid_pos:
-                    if current_pos != start_pos - 1 and current_pos != last_valid_pos - 1:
-                        logging.warning(f"Missed position(s) between {last_valid_pos} and {current_pos}")
-                    return current_time, current_pos
+                advanced = target_pos <= current_pos < last_valid_pos
+                step = last_valid_pos - 1
+            if advanced:
+                if current_pos != step:
+                    log.warning("Missed position(s) between %s and %s", last_valid_pos, current_pos)
+                return current_time, current_pos
         return last_valid_time, last_valid_pos
 
     def display_image(self, position, mode):
         # This is a placeholder for the actual image display logic from main.py
         # You would need to adapt the image loading and displaying code here.
-        logging.info(f"Displaying image for position {position} in mode {mode}")
-        image_path = f"/home/pi/sash/images/{mode}{position}.png"
-        if os.path.exists(image_path):
-            self.lcd.display_image(image_path)
-        else:
-            logging.warning(f"Image not found: {image_path}")
+        log.info("Displaying image for position %s in mode %s", position, mode)
+        image_path = self._image_paths.get((mode, position))
+        if image_path is None:
+            log.warning("Image not found: %s", os.path.join(IMAGE_DIR, f"{mode}{position}.png"))
+            return
+        self._post_lcd(image_path)
+
+    def _post_lcd(self, item):
+        while True:
+            try:
+                self._lcd_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._lcd_queue.get_nowait()  # superseded by this request
+                except queue.Empty:
+                    pass
+
+    def reload_images(self):
+        """
+        Index IMAGE_DIR as {(mode, position): path} from files named
+        <mode><position>.png, so display_image never touches the filesystem.
+        Called at startup; call again (the API does on SIGHUP) after adding images.
+        """
+        paths = {}
+        try:
+            names = os.listdir(IMAGE_DIR)
+        except OSError as e:
+            log.warning("Cannot list image directory %s: %s", IMAGE_DIR, e)
+            names = []
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext == ".png" and stem[-1:].isdigit() and int(stem[-1]) in POSITIONS:
+                paths[(stem[:-1], int(stem[-1]))] = os.path.join(IMAGE_DIR, name)
+        self._image_paths = paths
+
+    def _lcd_worker(self):
+        while True:
+            image_path = self._lcd_queue.get()
+            if image_path is None:  # shutdown sentinel from clean_exit
+                return
+            try:
+                self.lcd.set_background_img(1, image_path)
+            except Exception:
+                log.exception("Failed to display %s", image_path)
 
     def get_status(self):
         return {
             "current_position": self.get_current_position(),
-            "is_moving": self.movement_thread.is_alive() if self.movement_thread else False,
+            "is_moving": not self._idle.is_set(),
         }
 
     def get_equipment_status(self, message=None):
@@ -288,9 +572,48 @@ class SashActuator:
         }
 
     def _write_position_state(self):
+        self._state_queue.put(str(self.current_position))
+
+    def _state_writer(self):
+        q = self._state_queue
+        while True:
+            state = q.get()
+            stop = state is None  # shutdown sentinel from clean_exit
+            try:
+                # Skip to the newest queued position, but never past the
+                # sentinel: whatever was queued before it still gets written.
+                while not stop:
+                    try:
+                        newer = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    q.task_done()
+                    if newer is None:
+                        stop = True
+                    else:
+                        state = newer
+                if state is not None:
+                    self._store_position_state(state)
+            finally:
+                q.task_done()
+            if stop:
+                return
+
+    def _store_position_state(self, state):
         POSITION_STATE_FILE = self.config.get("POSITION_STATE_FILE", "/tmp/position_state")
+        if state == self._last_position_state:
+            return
+        # Write a temp file and atomically replace the old one so a crash
+        # mid-write never leaves a truncated or mixed state file behind.
+        tmp_path = POSITION_STATE_FILE + ".tmp"
         try:
-            with open(POSITION_STATE_FILE, "w") as f:
-                f.write(str(self.current_position))
-        except IOError as e:
-            logging.error(f"Failed to write position state to {POSITION_STATE_FILE}: {e}")
\ No newline at end of file
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, state.encode())
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, POSITION_STATE_FILE)
+        except OSError as e:
+            log.error("Failed to write position state to %s: %s", POSITION_STATE_FILE, e)
+            return
+        self._last_position_state = state
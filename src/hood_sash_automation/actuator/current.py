@@ -9,13 +9,26 @@ Provides raw shunt counts, converted current, and built-in current register read
 import smbus2
 
 class CurrentSensor:
-    def __init__(self, address=0x45, busnum=1, r_shunt=0.1, i_max=3.0):
+    # Shunt ADC (SADC, CONFIG bits 6..3) codes for N-sample hardware averaging
+    # at 12 bits; conversion time is ~532 µs per sample.
+    SADC_AVG = {1: 0b0011, 2: 0b1001, 4: 0b1010, 8: 0b1011,
+                16: 0b1100, 32: 0b1101, 64: 0b1110, 128: 0b1111}
+    CONFIG_DEFAULT = 0x399F  # power-on CONFIG: 32 V, /8 gain, 12-bit, continuous
+
+    def __init__(self, address=0x45, busnum=1, r_shunt=0.1, i_max=3.0, alpha=0.3,
+                 avg_samples=1):
         """
         address : I2C address of INA219
         busnum  : I2C bus number on the Pi
         r_shunt : shunt resistor value in ohms
         i_max   : full-scale current range in amps for calibration
+        alpha   : weight of each new sample in the read_filtered low-pass (0..1]
+        avg_samples : shunt samples the INA219 averages per reading (1-128, power of 2)
         """
+        if avg_samples not in self.SADC_AVG:
+            raise ValueError(
+                f"avg_samples must be one of {sorted(self.SADC_AVG)}, got {avg_samples!r}"
+            )
         self.address = address
         self.bus = smbus2.SMBus(busnum)
         self.r_shunt = r_shunt
@@ -24,27 +37,79 @@ class CurrentSensor:
         self.shunt_lsb_v = 10e-6
         self.shunt_current_lsb = self.shunt_lsb_v / self.r_shunt
 
+        # Let the INA219 average shunt samples in hardware, so each register
+        # read is already smoothed and no software spacing between reads is needed.
+        # A reading only changes once per conversion, so polling faster than
+        # this just repeats the previous value.
+        # CONFIG survives a process restart, so it is written every time;
+        # otherwise going back to 1 sample would keep the old averaging.
+        self.conversion_time = 532e-6 * avg_samples
+        config = (self.CONFIG_DEFAULT & ~(0xF << 3)) | (self.SADC_AVG[avg_samples] << 3)
+        self.bus.i2c_rdwr(
+            smbus2.i2c_msg.write(self.address, [0x00, config >> 8, config & 0xFF])
+        )
+
         # Setup INA219 calibration for direct current register use
         self.current_lsb = i_max / (2 ** 15)
         cal = int(0.04096 / (self.current_lsb * self.r_shunt))
-        msb = (cal >> 8) & 0xFF
-        lsb = cal & 0xFF
         # Write calibration to register 0x05
-        self.bus.write_i2c_block_data(self.address, 0x05, [msb, lsb])
+        w = smbus2.i2c_msg.write(self.address, [0x05, (cal >> 8) & 0xFF, cal & 0xFF])
+        self.bus.i2c_rdwr(w)
         # Read back for verification
-        data = self.bus.read_i2c_block_data(self.address, 0x05, 2)
-        self.cal_value_read = lambda: (data[0] << 8) | data[1]
+        self._cal_value = self._read_reg16(0x05, signed=False)
+
+        # The shunt read is the hot path, so its pointer-write/read message
+        # pair is built once and reused (the read buffer is overwritten).
+        self._shunt_msgs = (smbus2.i2c_msg.write(self.address, [0x01]),
+                            smbus2.i2c_msg.read(self.address, 2))
+        self.alpha = alpha
+        self._iir = None  # filtered shunt counts; None until the first sample
+
+    def cal_value_read(self):
+        """Return the calibration register value read back during __init__."""
+        return self._cal_value
+
+    def refresh_cal(self):
+        """Re-read the calibration register (e.g. after a sensor brown-out) and return it."""
+        self._cal_value = self._read_reg16(0x05, signed=False)
+        return self._cal_value
+
+    def _read_reg16(self, reg, signed=True):
+        """
+        Read a 16-bit big-endian register (two's complement unless signed=False).
+        The pointer write and data read go out as one repeated-START transfer.
+        """
+        w = smbus2.i2c_msg.write(self.address, [reg])
+        r = smbus2.i2c_msg.read(self.address, 2)
+        self.bus.i2c_rdwr(w, r)
+        return int.from_bytes(bytes(r), 'big', signed=signed)
 
     def read_raw_shunt(self):
         """
         Read signed raw shunt-voltage counts (register 0x01).
         Returns signed int (counts), where 1 count = 10 µV.
+        Reuses one message pair, so call it from a single thread at a time.
+        """
+        w, r = self._shunt_msgs
+        self.bus.i2c_rdwr(w, r)
+        return int.from_bytes(bytes(r), 'big', signed=True)
+
+    def read_filtered(self):
         """
-        data = self.bus.read_i2c_block_data(self.address, 0x01, 2)
-        raw = (data[0] << 8) | data[1]
-        if raw & 0x8000:
-            raw -= 1 << 16
-        return raw
+        Read raw shunt counts and fold them into a single-pole IIR low-pass,
+        y += alpha * (x - y), seeded with the first sample after reset_filter().
+        Returns the filtered counts.
+        """
+        raw = self.read_raw_shunt()
+        if self._iir is None:
+            self._iir = float(raw)
+        else:
+            self._iir += self.alpha * (raw - self._iir)
+        return self._iir
+
+    def reset_filter(self):
+        """Forget the filter state, e.g. before a new movement."""
+        self._iir = None
 
     def read_current_shunt(self):
         """
@@ -59,11 +124,7 @@ class CurrentSensor:
         Read the INA219 built-in current register (0x04) and return float in A.
         Uses calibration loaded in __init__.
         """
-        data = self.bus.read_i2c_block_data(self.address, 0x04, 2)
-        raw = (data[0] << 8) | data[1]
-        if raw & 0x8000:
-            raw -= 1 << 16
-        return raw * self.current_lsb
+        return self._read_reg16(0x04) * self.current_lsb
 
     def close(self):
         """Close the I2C bus."""
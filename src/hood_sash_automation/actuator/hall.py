@@ -21,26 +21,35 @@ hall.set_callback(cb)
 hall.close()                       # always call on exit
 """
 
+from array import array
+
 import RPi.GPIO as GPIO
-import threading
 
 class HallArray:
+    # BOTH-edge callbacks imply the level flipped, so the ISR skips the pin
+    # read; every Nth edge on a pin re-reads it to recover from edges lost
+    # to debounce.
+    RESYNC_EVERY = 8
+
     def __init__(self, pins, bouncetime=5):
         """
         pins : iterable of BCM GPIO numbers
         bouncetime : debounce in ms for edge detection
         """
         self.pins  = list(pins)
-        self._lock = threading.Lock()
+        self._pin_to_idx = {p: i for i, p in enumerate(self.pins)}
+        self._gpio_input = GPIO.input
         self._cb   = None
+        self._ver  = 0                       # bumped by the ISR after every store
 
         GPIO.setmode(GPIO.BCM)
 
         # Initialize actual state by reading pin levels
-        self.state = []
-        for p in self.pins:
-            GPIO.setup(p, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            self.state.append(GPIO.input(p))  # read actual state
+        self.state = array('b', [1]) * len(self.pins)
+        self._edges = array('L', [0]) * len(self.pins)  # per-pin edge counts
+        GPIO.setup(self.pins, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        for i, p in enumerate(self.pins):
+            self.state[i] = GPIO.input(p)     # read actual state
             GPIO.add_event_detect(
                 p,
                 GPIO.BOTH,
@@ -54,9 +63,15 @@ class HallArray:
         self._cb = func
 
     def snapshot(self):
-        """Return a thread-safe copy of the current sensor states."""
-        with self._lock:
-            return self.state.copy()
+        """
+        Return a consistent copy of the current sensor states.
+        Lock-free: the ISR is the only writer, so retry if it ran mid-copy.
+        """
+        while True:
+            ver  = self._ver
+            snap = self.state.tolist()
+            if ver == self._ver:
+                return snap
 
     def close(self):
         """Release GPIOs — call once before program exit."""
@@ -64,9 +79,13 @@ class HallArray:
 
     # ---------------- internal ISR -------------- #
     def _isr(self, channel):
-        idx   = self.pins.index(channel)
-        level = GPIO.input(channel)          # 0 = magnet present
-        with self._lock:
-            self.state[idx] = level
+        idx   = self._pin_to_idx[channel]
+        edges = self._edges[idx] = (self._edges[idx] + 1) % self.RESYNC_EVERY
+        if edges:
+            level = self.state[idx] ^ 1      # edge => level flipped
+        else:
+            level = self._gpio_input(channel)  # 0 = magnet present
+        self.state[idx] = level
+        self._ver += 1
         if self._cb:
             self._cb(channel, level, idx)
@@ -5,9 +5,12 @@ Based on DFRobot_LcdDisplay.h from:
 https://github.com/DFRobot/DFRobot_LcdDisplay/blob/master/src/DFRobot_LcdDisplay.h
 '''
 
+import logging
 import smbus2
 import time
 
+log = logging.getLogger(__name__)
+
 class DFRobotLCD:
     # I2C defaults
     DEFAULT_BUS  = 1
@@ -17,20 +20,52 @@ class DFRobotLCD:
     HDR_HIGH = 0x55
     HDR_LOW  = 0xAA
 
+    # Time the display firmware needs after power-up/bus open before it
+    # accepts commands.
+    BOOT_DELAY_S = 0.1
+
+    # Time the firmware needs to finish a command before it takes the next
+    # one. Only full-screen operations need settling; drawing primitives
+    # are accepted back to back.
+    CMD_DELAY_S = {
+        0x1D: 0.05,  # clean_screen
+        0x1A: 0.02,  # set_background_img
+        0x19: 0.02,  # set_background_color
+    }
+
     def __init__(self, bus=DEFAULT_BUS, address=DEFAULT_ADDR):
         self.bus = smbus2.SMBus(bus)
         self.addr = address
-        time.sleep(0.1)  # allow firmware to boot
+        self._bg_pkts = {}  # (location, path) -> encoded set_background_img packet
+        self._shown_bg = None  # (location, path) on screen, untouched since
+        self._ready_at = time.monotonic() + self.BOOT_DELAY_S
+
+    def _packet(self, cmd_id: int, params: bytes = b''):
+        # Built as one bytes object, led by the 0x00 register byte, so it goes
+        # out as a single raw I2C write with no list round-trip and no 32-byte
+        # SMBus block limit.
+        return bytes((0x00, self.HDR_HIGH, self.HDR_LOW, 1 + len(params), cmd_id)) + params
+
+    def _send(self, pkt):
+        # Settle time is only waited out if another command follows quickly,
+        # so a lone command returns as soon as it is on the bus.
+        remaining = self._ready_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[I2C SEND] CMD=0x%02X, LEN=%d", pkt[4], pkt[3])
+        self.bus.i2c_rdwr(smbus2.i2c_msg.write(self.addr, pkt))
+        self._ready_at = time.monotonic() + self.CMD_DELAY_S.get(pkt[4], 0)
 
     def _cmd(self, cmd_id: int, params: bytes = b''):
-        length = 1 + len(params)
-        pkt = [self.HDR_HIGH, self.HDR_LOW, length, cmd_id] + list(params)
-        print(f"[I2C SEND] CMD=0x{cmd_id:02X}, LEN={length}, BYTES={pkt}")
-        self.bus.write_i2c_block_data(self.addr, 0x00, pkt)
-        time.sleep(0.01)
+        self._shown_bg = None  # anything else may change what is on screen
+        self._send(self._packet(cmd_id, params))
 
     def begin(self):
-        time.sleep(0.1)
+        """Wait out whatever is left of the firmware boot delay."""
+        remaining = self._ready_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
     def clean_screen(self):
         self._cmd(0x1D)
@@ -46,9 +81,17 @@ class DFRobotLCD:
         self._cmd(0x41, bytes([b]))
 
     def set_background_img(self, location: int, path: str):
-        data = path.encode('utf-8')  # Do NOT null-terminate
-        params = bytes([location]) + data
-        self._cmd(0x1A, params)
+        # The display decodes the image itself; only the packet is built here,
+        # and the same few backgrounds are shown over and over, so cache it.
+        key = (location, path)
+        if key == self._shown_bg:
+            return  # already on screen, nothing drawn over it since
+        pkt = self._bg_pkts.get(key)
+        if pkt is None:
+            data = path.encode('utf-8')  # Do NOT null-terminate
+            pkt = self._bg_pkts[key] = self._packet(0x1A, bytes([location]) + data)
+        self._send(pkt)
+        self._shown_bg = key
 
 
     def draw_pixel(self, x: int, y: int, rgb: int):
@@ -1,14 +1,65 @@
+import mmap
+import os
 import threading
 import time
+from collections import deque
 
 import RPi.GPIO as GPIO
 
 
+class GPIOBank:
+    """Read the levels of BCM GPIO 0-31 with one load of the GPLEV0 register."""
+
+    GPLEV0 = 0x34
+    # SoCs sharing the BCM2835 GPIO register map (Pi 1-4). The Pi 5 routes
+    # GPIO through RP1, whose registers are laid out differently.
+    COMPATIBLE = (b"brcm,bcm2835", b"brcm,bcm2836", b"brcm,bcm2837", b"brcm,bcm2711")
+
+    def __init__(self, path="/dev/gpiomem"):
+        fd = os.open(path, os.O_RDWR | os.O_SYNC)
+        try:
+            self._mem = mmap.mmap(fd, mmap.PAGESIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        self._regs = memoryview(self._mem).cast("I")
+        self._lev_idx = self.GPLEV0 // 4
+
+    @classmethod
+    def try_open(cls, path="/dev/gpiomem"):
+        """Return a GPIOBank, or None when the registers cannot be mapped here."""
+        try:
+            fd = os.open("/proc/device-tree/compatible", os.O_RDONLY)
+            try:
+                compatible = os.read(fd, 256)
+            finally:
+                os.close(fd)
+            if not any(soc in compatible for soc in cls.COMPATIBLE):
+                return None
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    def levels(self):
+        """Return GPLEV0 as an int; bit n is the level of BCM GPIO n."""
+        return self._regs[self._lev_idx]
+
+    def close(self):
+        self._regs.release()
+        self._mem.close()
+
+
 class HallArray:
     """Poll active-low Hall sensors and emit callbacks when their level changes."""
 
+    # Accepted edges are also queued as (idx, level, t) for consumers that
+    # want the sample time rather than the time the callback got to run.
+    EVENT_QUEUE_LEN = 256
+
     def __init__(self, pins, bouncetime=5, poll_interval=0.02):
         self.pins = list(pins)
+        self._pin_to_idx = {pin: i for i, pin in enumerate(self.pins)}
+        self.mask = sum(1 << pin for pin in self.pins)  # bank bits of the configured pins
+        self._gpio_input = GPIO.input
         self.state = [1] * len(self.pins)
         self._lock = threading.Lock()
         self._cb = None
@@ -16,11 +67,17 @@ class HallArray:
         self.poll_interval = poll_interval
         self.bouncetime = bouncetime / 1000.0
         self._last_event = [0.0] * len(self.pins)
+        self.events = deque(maxlen=self.EVENT_QUEUE_LEN)
+        # Direct register reads when available; GPIO.input() per pin otherwise.
+        self._bank = GPIOBank.try_open()
 
         GPIO.setmode(GPIO.BCM)
+        GPIO.setup(self.pins, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         for i, pin in enumerate(self.pins):
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             self.state[i] = GPIO.input(pin)
+        # self.state packed like snapshot_bits(), kept in step with it so a
+        # bank poll can tell "nothing to do" from a single compare.
+        self._state_bits = self._pack(self.state)
 
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
@@ -32,29 +89,92 @@ class HallArray:
     def snapshot(self):
         """Return a thread-safe live read of all configured GPIO pins."""
         with self._lock:
-            for i, pin in enumerate(self.pins):
-                self.state[i] = GPIO.input(pin)
+            bank = self._bank
+            if bank is not None:
+                levels = bank.levels()
+                for i, pin in enumerate(self.pins):
+                    self.state[i] = (levels >> pin) & 1
+            else:
+                for i, pin in enumerate(self.pins):
+                    self.state[i] = GPIO.input(pin)
+            self._state_bits = self._pack(self.state)
             return self.state.copy()
 
+    def _pack(self, levels):
+        return sum(level << pin for level, pin in zip(levels, self.pins))
+
+    def snapshot_bits(self):
+        """
+        Return a live read of all pins packed GPLEV0-style: bit `pin` holds
+        that pin's level and every bit outside `mask` is zero.
+        """
+        # The bank is read under the lock so close() cannot unmap it mid-read.
+        with self._lock:
+            bank = self._bank
+            if bank is not None:
+                return bank.levels() & self.mask
+        gpio_input = self._gpio_input
+        bits = 0
+        for pin in self.pins:
+            if gpio_input(pin):
+                bits |= 1 << pin
+        return bits
+
+    def pop_events(self):
+        """Return and clear the queued (idx, level, t) edge events, oldest first."""
+        with self._lock:
+            events = list(self.events)
+            self.events.clear()
+        return events
+
     def close(self):
         """Stop polling and release the configured GPIO pins."""
         self._stop.set()
         self._thread.join(timeout=1)
+        # API threads may still be reading; once the lock is held they either
+        # finished with the bank or will fall back to GPIO.input.
+        with self._lock:
+            bank, self._bank = self._bank, None
+            if bank is not None:
+                bank.close()
         GPIO.cleanup(self.pins)
 
     def _poll_loop(self):
+        # Schedule against a monotonic deadline so the poll phase does not
+        # drift by the time each pass takes.
+        next_poll = time.monotonic()
         while not self._stop.is_set():
             self._poll_once()
-            time.sleep(self.poll_interval)
+            next_poll += self.poll_interval
+            delay = next_poll - time.monotonic()
+            if delay < 0:
+                # Overran a period; resync instead of bursting to catch up.
+                next_poll -= delay
+                delay = 0
+            self._stop.wait(delay)
 
     def _poll_once(self):
+        # Stamp the pass once, at sampling time, so every edge it finds
+        # carries the moment the pins were read.
+        now = time.monotonic()
+        bank = self._bank
+        if bank is not None:
+            # One register load for every pin; most passes see no change
+            # and end here without taking the lock.
+            levels = bank.levels() & self.mask
+            if levels == self._state_bits:
+                return
+            for idx, pin in enumerate(self.pins):
+                self._handle_level(pin, idx, (levels >> pin) & 1, now)
+            return
+        gpio_input = self._gpio_input
         for idx, pin in enumerate(self.pins):
-            level = GPIO.input(pin)
-            self._handle_level(pin, idx, level)
+            self._handle_level(pin, idx, gpio_input(pin), now)
 
-    def _handle_level(self, pin, idx, level):
+    def _handle_level(self, pin, idx, level, now=None):
         callback = None
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
 
         with self._lock:
             if level == self.state[idx]:
@@ -63,7 +183,9 @@ class HallArray:
                 return
 
             self.state[idx] = level
+            self._state_bits ^= 1 << pin
             self._last_event[idx] = now
+            self.events.append((idx, level, now))
             callback = self._cb
 
         if callback:
@@ -71,5 +193,5 @@ class HallArray:
 
     def _isr(self, channel):
         """Compatibility hook for tests; production hardware uses polling."""
-        idx = self.pins.index(channel)
-        self._handle_level(channel, idx, GPIO.input(channel))
+        idx = self._pin_to_idx[channel]
+        self._handle_level(channel, idx, self._gpio_input(channel))
@@ -1,6 +1,7 @@
 # src/hood_sash_automation/api/api_service.py
 import signal
-import yaml
+import sys
+import threading
 import os
 import socket
 import fcntl
@@ -9,6 +10,7 @@ from pathlib import Path
 from flask import Flask, request, jsonify
 from ..actuator.controller import SashActuator
 from ..actuator.buttons import PhysicalButtons
+from ..config import load_yaml
 
 SIOCGIFADDR = 0x8915
 
@@ -40,7 +42,7 @@ def create_app():
             Path(__file__).resolve().parents[1] / "config" / "actuator_config.yaml"
         ))
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return load_yaml(f)
 
     config = load_config()
     equipment_ip = config.get('equipment_ip') or get_interface_ip(
@@ -65,6 +67,10 @@ def create_app():
         'POSITION_STATE_FILE': config['position_state_file'],
         'LOG_DIR': config['log_dir'],
         'HOME_ON_STARTUP': config.get('home_on_startup', False),
+        'CURRENT_SAMPLE_INTERVAL': config.get('current_sample_interval', 0.002),
+        'CURRENT_FILTER_ALPHA': config.get('current_filter_alpha', 0.3),
+        'CURRENT_AVG_SAMPLES': config.get('current_avg_samples', 1),
+        'INRUSH_SKIP_TIME': config.get('inrush_skip_time', 0.5),
         'EQUIPMENT_NAME': config.get('equipment_name', 'fume_hood_sash_actuator'),
         'EQUIPMENT_IP': equipment_ip,
         'EQUIPMENT_TAILSCALE': equipment_tailscale,
@@ -122,25 +128,37 @@ def create_app():
         position = app.actuator.get_current_position()
         return jsonify({"position": position})
 
+    shutting_down = threading.Event()
+    app.buttons = None
+
     def cleanup(signum, frame):
+        # A second SIGINT/SIGTERM must not re-enter clean_exit halfway through.
+        if shutting_down.is_set():
+            return
+        shutting_down.set()
         print("Caught signal, cleaning up...")
+        app.actuator.relay.all_off()  # de-energise the motor before anything that can block
+        if app.buttons is not None:
+            app.buttons.close()  # no presses once the actuator starts shutting down
         app.actuator.clean_exit()
-        exit(0)
+        sys.exit(0)
 
     signal.signal(signal.SIGINT, cleanup)
     signal.signal(signal.SIGTERM, cleanup)
+    # Re-index the LCD image directory without restarting the service.
+    signal.signal(signal.SIGHUP, lambda signum, frame: app.actuator.reload_images())
 
     # Start physical button handler in the app context if not testing
     if os.environ.get("FLASK_ENV") != "testing":
         button_config = config.get('buttons', {})
         if button_config.get('up_pin') and button_config.get('down_pin'):
-            button_handler = PhysicalButtons(
+            app.buttons = PhysicalButtons(
                 app.actuator,
                 up_pin=button_config['up_pin'],
                 down_pin=button_config['down_pin'],
                 stop_pin=button_config.get('stop_pin')
             )
-            button_handler.start()
+            app.buttons.start()
 
     return app
 
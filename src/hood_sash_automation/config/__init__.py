@@ -1 +1,9 @@
 """Default configuration files bundled with hood_sash_automation."""
+import yaml
+
+
+def load_yaml(stream):
+    """Parse a YAML config stream with safe_load semantics."""
+    # libyaml's C loader when PyYAML was built with it; same safe subset either way.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)  # nosec B506 - always a SafeLoader
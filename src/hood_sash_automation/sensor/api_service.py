@@ -1,11 +1,11 @@
 # src/hood_sash_automation/sensor/api_service.py
 import signal
 import logging
-import yaml
 import os
 from pathlib import Path
 from flask import Flask, jsonify
 from .sensor import SashSensor
+from ..config import load_yaml
 
 def load_config():
     """Load configuration from YAML file."""
@@ -14,7 +14,7 @@ def load_config():
         Path(__file__).resolve().parents[1] / "config" / "sensor_config.yaml"
     ))
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return load_yaml(f)
 
 # Load configuration
 config = load_config()
@@ -2,35 +2,49 @@
 
 import RPi.GPIO as GPIO
 import threading
-import time
 import logging
 
 class SashSensor(threading.Thread):
-    def __init__(self, hall_pin, led_pin, poll_interval=0.05):
+    def __init__(self, hall_pin, led_pin, bouncetime=50, resync_interval=1.0):
         super().__init__(daemon=True)
         self.hall_pin = hall_pin
         self.led_pin = led_pin
-        self.poll_interval = poll_interval
+        self.bouncetime = bouncetime
+        # Edges drive updates; this slow re-read only catches an edge that
+        # the debounce swallowed.
+        self.resync_interval = resync_interval
 
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.hall_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         GPIO.setup(self.led_pin, GPIO.OUT)
 
         self._lock = threading.Lock()
+        self._stopped = threading.Event()
         self._state = self.get_state_from_gpio()
         self.on_state_change = None
 
     def run(self):
-        while True:
-            current_state = self.get_state_from_gpio()
-            with self._lock:
-                if current_state != self._state:
-                    self._state = current_state
-                    logging.info(f"Sensor state changed: {self._state}")
-                    GPIO.output(self.led_pin, GPIO.HIGH if self._state else GPIO.LOW)
-                    if self.on_state_change:
-                        self.on_state_change(self._state)
-            time.sleep(self.poll_interval)
+        GPIO.add_event_detect(self.hall_pin, GPIO.BOTH,
+                              callback=self._on_edge, bouncetime=self.bouncetime)
+        while not self._stopped.wait(self.resync_interval):
+            self._update(self.get_state_from_gpio())
+
+    def _on_edge(self, channel):
+        self._update(self.get_state_from_gpio())
+
+    def _update(self, current_state):
+        # The edge callback and the resync loop can race here, so the state
+        # swap is locked; the listener runs outside the lock so a slow one
+        # cannot hold up get_current_state() or the next edge.
+        with self._lock:
+            if self._stopped.is_set() or current_state == self._state:
+                return
+            self._state = current_state
+            GPIO.output(self.led_pin, GPIO.HIGH if current_state else GPIO.LOW)
+            callback = self.on_state_change
+        logging.info("Sensor state changed: %s", current_state)
+        if callback:
+            callback(current_state)
 
     def get_state_from_gpio(self):
         """Returns True if magnet present (sash up), False if not (sash down)"""
@@ -41,4 +55,11 @@ class SashSensor(threading.Thread):
             return self._state
 
     def cleanup(self):
-        GPIO.cleanup([self.hall_pin, self.led_pin])
+        # Stop the resync loop and the edge callback before the pins are
+        # released, so nothing drives the LED pin after GPIO.cleanup.
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        GPIO.remove_event_detect(self.hall_pin)
+        with self._lock:  # waits out an _update already in progress
+            GPIO.cleanup([self.hall_pin, self.led_pin])
@@ -74,6 +74,12 @@ def add_event_detect(channel, edge, callback=None, bouncetime=None):
     _pins[channel]['event'] = {'edge': edge, 'callback': callback, 'bouncetime': bouncetime}
     logging.info(f"Event detection added for pin {channel} on edge {'BOTH' if edge == BOTH else 'N/A'}")
 
+def remove_event_detect(channel):
+    """Removes event detection for a GPIO pin (mocked)."""
+    if channel in _pins:
+        _pins[channel]['event'] = None
+    logging.info(f"Event detection removed for pin {channel}")
+
 def cleanup(channel=None):
     """Resets GPIO pin configurations."""
     global _pins, _pin_mode
@@ -9,9 +9,40 @@ import logging
 # Example: _i2c_devices = {0x45: {0x01: [0x12, 0x34], 0x05: [0xAB, 0xCD]}}
 _i2c_devices = {}
 
+# Register pointer last written to each device by a bare i2c_msg write.
+_pointers = {}
+
 # --- Logging ---
 logging.basicConfig(level=logging.INFO, format='[MockSMBus] %(message)s')
 
+class i2c_msg:
+    """A mock of smbus2.i2c_msg holding its payload in a bytearray."""
+
+    def __init__(self, addr, flags, buf):
+        self.addr = addr
+        self.flags = flags
+        self.buf = buf
+        self.len = len(buf)
+
+    @staticmethod
+    def read(address, length):
+        """Prepares a read message of `length` bytes."""
+        return i2c_msg(address, 1, bytearray(length))
+
+    @staticmethod
+    def write(address, buf):
+        """Prepares a write message carrying `buf`."""
+        return i2c_msg(address, 0, bytearray(buf))
+
+    def __len__(self):
+        return self.len
+
+    def __iter__(self):
+        return iter(self.buf)
+
+    def __bytes__(self):
+        return bytes(self.buf)
+
 class SMBus:
     """A mock SMBus class that simulates I2C communication."""
 
@@ -43,6 +74,27 @@ class SMBus:
         logging.info(f"Read from addr=0x{i2c_addr:02X} reg=0x{register:02X} -> data={response}")
         return response
 
+    def write_word_data(self, i2c_addr, register, value):
+        """Mocks writing a 16-bit word (SMBus order: low byte first)."""
+        self.write_i2c_block_data(i2c_addr, register, [value & 0xFF, (value >> 8) & 0xFF])
+
+    def read_word_data(self, i2c_addr, register):
+        """Mocks reading a 16-bit word (SMBus order: first byte is the low byte)."""
+        data = self.read_i2c_block_data(i2c_addr, register, 2)
+        return data[0] | (data[1] << 8)
+
+    def i2c_rdwr(self, *i2c_msgs):
+        """Mocks a combined transfer: writes set the register pointer, reads return it."""
+        for msg in i2c_msgs:
+            if msg.flags & 1:
+                register = _pointers.get(msg.addr, 0)
+                msg.buf[:] = bytes(self.read_i2c_block_data(msg.addr, register, msg.len))
+            else:
+                data = list(msg.buf)
+                _pointers[msg.addr] = data[0]
+                if len(data) > 1:
+                    self.write_i2c_block_data(msg.addr, data[0], data[1:])
+
     def close(self):
         """Mocks closing the I2C bus."""
         logging.info(f"Mock SMBus closed on bus {self.busnum}")
@@ -61,4 +113,5 @@ def get_i2c_register(address, register):
 
 def clear_i2c_devices():
     """A helper to reset the I2C mock state between tests."""
-    _i2c_devices.clear()
\ No newline at end of file
+    _i2c_devices.clear()
+    _pointers.clear()
\ No newline at end of file
@@ -12,5 +12,9 @@ spec = importlib.util.spec_from_file_location("smbus2_mock", _mock_file)
 smbus2_mock = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(smbus2_mock)
 
-# Export the SMBus class
-SMBus = smbus2_mock.SMBus
\ No newline at end of file
+# Export the SMBus class, message type and test helpers
+SMBus = smbus2_mock.SMBus
+i2c_msg = smbus2_mock.i2c_msg
+set_i2c_register = smbus2_mock.set_i2c_register
+get_i2c_register = smbus2_mock.get_i2c_register
+clear_i2c_devices = smbus2_mock.clear_i2c_devices
\ No newline at end of file
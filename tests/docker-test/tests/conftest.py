@@ -0,0 +1,38 @@
+# tests/conftest.py
+"""Helpers and fixtures shared by the docker-test suites."""
+import time
+
+import pytest
+
+
+def wait_for(predicate, timeout=1.0):
+    """Poll `predicate` until it is truthy; False if `timeout` seconds pass first."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def pack_bits(levels, pins):
+    """Pack per-sensor levels the way HallArray.snapshot_bits() reports them."""
+    return sum(level << pin for level, pin in zip(levels, pins))
+
+
+@pytest.fixture
+def gpio_pins():
+    """
+    Claim pins on the mock RPi.GPIO from tests/docker-test/mock_hardware.
+    `gpio = gpio_pins(17, 27)` returns the module; the pins are released
+    after the test.
+    """
+    import RPi.GPIO as GPIO
+    claimed = []
+
+    def claim(*pins):
+        claimed.extend(pins)
+        return GPIO
+    yield claim
+    if claimed:
+        GPIO.cleanup(claimed)
@@ -1,6 +1,8 @@
 # tests/test_actuator_controller.py
 import pytest
 
+from conftest import pack_bits
+
 # A sample config dictionary for testing
 SAMPLE_CONFIG = {
     'HALL_PINS': [5, 6, 13, 19, 26], 'BOUNCE_MS': 10, 'RELAY_EXT': 27, 'RELAY_RET': 17,
@@ -10,6 +12,8 @@ SAMPLE_CONFIG = {
     'LOG_DIR': "/tmp/test_log", 'EQUIPMENT_NAME': "fume_hood_sash_actuator",
     'EQUIPMENT_IP': "172.31.32.236", 'EQUIPMENT_TAILSCALE': "100.64.254.100",
 }
+HALL_PINS = SAMPLE_CONFIG['HALL_PINS']
+
 
 @pytest.fixture
 def mock_hardware(mocker):
@@ -20,7 +24,8 @@ def mock_hardware(mocker):
     # Configure the instance that will be created by the class mock
     mock_cs_instance = mock_cs_class.return_value
     mock_cs_instance.cal_value_read.return_value = 4096 # Return a simple int
-    mock_cs_instance.read_raw_shunt.return_value = 0 # Simulate normal current
+    mock_cs_instance.read_filtered.return_value = 0.0 # Simulate normal current
+    mock_cs_instance.conversion_time = 532e-6
 
     mocker.patch('hood_sash_automation.actuator.controller.HallArray')
     mocker.patch('hood_sash_automation.actuator.controller.DFRobotLCD')
@@ -49,15 +54,17 @@ def test_move_up_command(mock_hardware, mocker):
 
     mocker.patch('threading.Thread.start')
     mock_hall_instance = HallArray.return_value
-    mock_hall_instance.snapshot.return_value = [0, 1, 1, 1, 1]
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
 
     SashActuator.home_on_startup = lambda self: None
     actuator = SashActuator(SAMPLE_CONFIG)
 
-    actuator.move_to_position_async(3)
+    assert actuator.move_to_position_async(3) is True
+    assert actuator.move_to_position_async(4) is False  # one move at a time
 
     mock_relay_instance = ActuatorRelay.return_value
-    assert actuator.movement_thread._target == actuator.move_to_position
+    assert actuator.movement_thread._target == actuator._movement_worker
+    assert actuator._move_queue.get_nowait() == (3, 'position')
 
     actuator.move_to_position(target_pos=3, mode='position')
 
@@ -70,9 +77,9 @@ def test_status_uses_live_hall_snapshot(mock_hardware):
     from hood_sash_automation.actuator.controller import SashActuator, HallArray
 
     mock_hall_instance = HallArray.return_value
-    mock_hall_instance.snapshot.side_effect = [
-        [1, 1, 1, 1, 0],  # Initial position during construction.
-        [1, 1, 1, 1, 1],  # Live status read after leaving the sensor.
+    mock_hall_instance.snapshot_bits.side_effect = [
+        pack_bits([1, 1, 1, 1, 0], HALL_PINS),  # Initial position during construction.
+        pack_bits([1, 1, 1, 1, 1], HALL_PINS),  # Live status read after leaving the sensor.
     ]
 
     actuator = SashActuator(SAMPLE_CONFIG)
@@ -87,7 +94,7 @@ def test_equipment_status_reports_ready_schema(mock_hardware):
     from hood_sash_automation.actuator.controller import SashActuator, HallArray
 
     mock_hall_instance = HallArray.return_value
-    mock_hall_instance.snapshot.return_value = [1, 0, 1, 1, 1]
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([1, 0, 1, 1, 1], HALL_PINS)
 
     actuator = SashActuator(SAMPLE_CONFIG)
     status = actuator.get_equipment_status()
@@ -111,7 +118,7 @@ def test_stop_sets_equipment_status_stopped(mock_hardware):
     from hood_sash_automation.actuator.controller import SashActuator, HallArray
 
     mock_hall_instance = HallArray.return_value
-    mock_hall_instance.snapshot.return_value = [0, 1, 1, 1, 1]
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
 
     actuator = SashActuator(SAMPLE_CONFIG)
     actuator.stop()
@@ -121,3 +128,219 @@ def test_stop_sets_equipment_status_stopped(mock_hardware):
     assert status["message"] == "Stop command issued - System is STOPPED"
     assert status["system_state"] == "stopped"
     assert status["sash_state"] == "stopped"
+
+
+def test_multiple_active_hall_sensors_is_not_a_position(mock_hardware):
+    """Test that a snapshot with more than one active sensor reports no position."""
+    from hood_sash_automation.actuator.controller import SashActuator, HallArray
+
+    mock_hall_instance = HallArray.return_value
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([1, 0, 0, 1, 1], HALL_PINS)
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+
+    assert actuator.get_current_position() is None
+
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([1, 1, 1, 0, 1], HALL_PINS)
+    assert actuator.get_current_position() == 4
+
+
+def test_search_stops_on_collision_current(mock_hardware, mocker):
+    """Test that the position search ends early and reports nothing found on overcurrent."""
+    from hood_sash_automation.actuator.controller import SashActuator, ActuatorRelay, CurrentSensor, HallArray
+
+    HallArray.return_value.snapshot_bits.return_value = pack_bits([1, 1, 1, 1, 1], HALL_PINS)
+    CurrentSensor.return_value.read_filtered.return_value = -2000.0
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+
+    assert actuator._search_down() is None
+    mock_relay_instance = ActuatorRelay.return_value
+    mock_relay_instance.down_on.assert_called_once()
+    mock_relay_instance.all_off.assert_called_once()
+
+
+def test_collision_check_direction_follows_the_move(mock_hardware):
+    """Test that the collision check compares by move direction, not by threshold sign."""
+    from hood_sash_automation.actuator.controller import SashActuator, CurrentSensor
+
+    actuator = SashActuator({**SAMPLE_CONFIG, 'CURRENT_THRESHOLD_DOWN': 0})
+    read_filtered = CurrentSensor.return_value.read_filtered
+
+    read_filtered.return_value = 500.0
+    assert actuator._check_movement_current("down")
+    assert actuator._check_movement_current("up")
+
+    read_filtered.return_value = -1.0
+    assert not actuator._check_movement_current("down")
+
+    read_filtered.return_value = 1301.0
+    assert not actuator._check_movement_current("up")
+
+
+def test_move_warns_about_skipped_positions(mock_hardware, mocker):
+    """Test that reaching the target without seeing every position in between is reported."""
+    from hood_sash_automation.actuator.controller import SashActuator, CurrentSensor, HallArray
+
+    mock_log = mocker.patch('hood_sash_automation.actuator.controller.log')
+    mock_hall_instance = HallArray.return_value
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+    actuator.display_mode = None
+
+    def jump_to_position_3():
+        # Sensor 2 (position 3) fires without position 2 ever being seen.
+        mock_hall_instance.snapshot_bits.return_value = pack_bits([1, 1, 0, 1, 1], HALL_PINS)
+        actuator.hall_callback(13, 0, 2)
+        return 0
+    CurrentSensor.return_value.read_filtered.side_effect = jump_to_position_3
+
+    actuator.move_to_position(target_pos=3, mode=None)
+
+    assert actuator.current_position == 3
+    warnings = [c.args[0] % c.args[1:] for c in mock_log.warning.call_args_list]
+    assert "Position(s) [2] not detected between 1 and 3" in warnings
+
+
+def test_move_counts_positions_seen_during_inrush(mock_hardware, mocker):
+    """Test that edges during the inrush delay and a polled arrival at the target raise no missed-position warning."""
+    from hood_sash_automation.actuator.controller import SashActuator, HallArray
+
+    mock_log = mocker.patch('hood_sash_automation.actuator.controller.log')
+    mock_hall_instance = HallArray.return_value
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
+    mock_hall_instance.pop_events.return_value = []
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+    actuator.display_mode = None
+
+    def fast_inrush():
+        # Position 2 passes before supervision starts; position 3 is then
+        # picked up by a status poll rather than the Hall callback.
+        actuator.hall_callback(6, 0, 1)
+        mock_hall_instance.snapshot_bits.return_value = pack_bits([1, 1, 0, 1, 1], HALL_PINS)
+        actuator.get_current_position()
+    mocker.patch.object(actuator, '_skip_inrush', side_effect=fast_inrush)
+
+    actuator.move_to_position(target_pos=3, mode=None)
+
+    assert actuator.current_position == 3
+    warnings = [c.args[0] % c.args[1:] for c in mock_log.warning.call_args_list]
+    assert not any("not detected" in w or "Missed" in w for w in warnings)
+
+
+def test_move_validates_queued_hall_edges_in_order(mock_hardware, mocker):
+    """Test that sequence validation replays the queued Hall edges, not the live position."""
+    import time
+    from hood_sash_automation.actuator.controller import SashActuator, CurrentSensor, HallArray
+
+    mock_log = mocker.patch('hood_sash_automation.actuator.controller.log')
+    mock_hall_instance = HallArray.return_value
+    mock_hall_instance.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
+    mock_hall_instance.pop_events.return_value = []
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+    actuator.display_mode = None
+    samples = []
+
+    def current_sample():
+        # First sample: position 3 arrives, skipping 2. Second: the target.
+        samples.append(None)
+        if len(samples) == 1:
+            mock_hall_instance.pop_events.return_value = [(2, 0, time.monotonic())]
+            actuator.hall_callback(13, 0, 2)
+        elif len(samples) == 2:
+            mock_hall_instance.pop_events.return_value = []
+            actuator.hall_callback(19, 0, 3)
+        return 0
+    CurrentSensor.return_value.read_filtered.side_effect = current_sample
+
+    actuator.move_to_position(target_pos=4, mode=None)
+
+    assert actuator.current_position == 4
+    warnings = [c.args[0] % c.args[1:] for c in mock_log.warning.call_args_list]
+    assert "Missed position(s) between 1 and 3" in warnings
+
+
+def test_display_image_keeps_only_latest_pending_image(mock_hardware, mocker):
+    """Test that a newer LCD request replaces one the worker has not drawn yet."""
+    from hood_sash_automation.actuator.controller import SashActuator, DFRobotLCD
+
+    mocker.patch('threading.Thread.start')  # keep the LCD worker from draining
+    mocker.patch('hood_sash_automation.actuator.controller.os.listdir',
+                 return_value=['position2.png', 'position3.png', 'notes.txt'])
+    mock_exists = mocker.patch('hood_sash_automation.actuator.controller.os.path.exists')
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+    actuator.display_image(2, 'position')
+    actuator.display_image(3, 'position')
+    actuator.display_image(4, 'position')  # no such image: nothing queued
+
+    assert actuator._lcd_queue.get_nowait() == "/home/pi/sash/images/position3.png"
+    assert actuator._lcd_queue.empty()
+    mock_exists.assert_not_called()  # the directory was indexed once at startup
+    DFRobotLCD.return_value.set_background_img.assert_not_called()
+
+
+def test_clean_exit_stops_workers(mock_hardware):
+    """Test that clean_exit ends the movement and LCD workers before releasing hardware."""
+    from unittest.mock import call
+    from hood_sash_automation.actuator.controller import SashActuator, ActuatorRelay, CurrentSensor, HallArray
+
+    HallArray.return_value.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
+
+    actuator = SashActuator(SAMPLE_CONFIG)
+    actuator.clean_exit()
+
+    assert not actuator.movement_thread.is_alive()
+    assert not actuator._lcd_thread.is_alive()
+    HallArray.return_value.close.assert_called_once()
+    CurrentSensor.return_value.close.assert_called_once()
+    ActuatorRelay.return_value.close.assert_called_once()
+    assert ActuatorRelay.return_value.method_calls[0] == call.all_off()
+
+
+def test_stop_cuts_inrush_skip_short(mock_hardware, mocker):
+    """Test that a stop during the start-up current skip ends the move at once."""
+    import time
+    from hood_sash_automation.actuator.controller import SashActuator, ActuatorRelay, HallArray
+
+    mocker.patch('threading.Thread.start')
+    HallArray.return_value.snapshot_bits.return_value = pack_bits([0, 1, 1, 1, 1], HALL_PINS)
+
+    actuator = SashActuator({**SAMPLE_CONFIG, 'INRUSH_SKIP_TIME': 30.0})
+    ActuatorRelay.return_value.up_on.side_effect = actuator.stop_flag.set
+
+    started = time.monotonic()
+    actuator.move_to_position(target_pos=3, mode=None)
+
+    assert time.monotonic() - started < 5
+    assert actuator.equipment_status == "stopped"
+    ActuatorRelay.return_value.all_off.assert_called()
+
+
+def test_logging_is_set_up_once_per_process(mocker, tmp_path):
+    """Test that a second controller reuses the configured root logger and the listener is torn down."""
+    import logging
+    from hood_sash_automation.actuator.controller import SashActuator
+
+    root = logging.getLogger()
+    mocker.patch.object(root, 'handlers', [])
+    mocker.patch.object(root, 'level', root.level)
+
+    first = SashActuator.__new__(SashActuator)
+    first.config = {'LOG_DIR': str(tmp_path)}
+    first._log_listener = None
+    first._setup_logging()
+    second = SashActuator.__new__(SashActuator)
+    second.config = first.config
+    second._log_listener = None
+    second._setup_logging()
+
+    assert root.handlers == [first._log_handler]
+    assert second._log_listener is None
+
+    first._stop_logging()
+    assert root.handlers == []
+    assert first._log_listener is None
@@ -0,0 +1,36 @@
+# tests/test_buttons.py
+"""Tests for the PhysicalButtons press handler."""
+from unittest.mock import MagicMock
+
+from conftest import wait_for
+
+UP_PIN = 20
+DOWN_PIN = 21
+STOP_PIN = 16
+
+
+def test_presses_are_registered_and_removed_on_close(gpio_pins):
+    """Tests that run() registers a press callback per button and close() removes them."""
+    from hood_sash_automation.actuator.buttons import PhysicalButtons
+
+    gpio = gpio_pins(UP_PIN, DOWN_PIN, STOP_PIN)
+
+    actuator = MagicMock()
+    buttons = PhysicalButtons(actuator, UP_PIN, DOWN_PIN, stop_pin=STOP_PIN)
+    buttons.start()
+    pins = (UP_PIN, DOWN_PIN, STOP_PIN)
+    assert wait_for(lambda: all(gpio.get_pin_state(p)['event'] for p in pins))
+    assert all(gpio.get_pin_state(p)['event']['edge'] == gpio.FALLING for p in pins)
+
+    # Each press reaches its handler
+    gpio.set_pin_value(UP_PIN, gpio.LOW)
+    gpio.set_pin_value(DOWN_PIN, gpio.LOW)
+    gpio.set_pin_value(STOP_PIN, gpio.LOW)
+    actuator.move_to_position_async.assert_any_call(5)
+    actuator.move_to_position_async.assert_any_call(1)
+    actuator.stop.assert_called_once()
+
+    buttons.close()
+
+    assert not buttons.is_alive()
+    assert all(gpio.get_pin_state(p)['event'] is None for p in pins)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the CurrentSensor class from current.py.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def _reply(data):
+    """Build an i2c_rdwr side effect that fills the final read message with `data`."""
+    def i2c_rdwr(*msgs):
+        msgs[-1].buf[:] = data
+    return i2c_rdwr
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_read_raw_shunt_sign_extends(mock_smbus):
+    """Tests that raw shunt counts are decoded as signed big-endian words."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    sensor = CurrentSensor()
+
+    # Act & Assert
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\x05\x14')
+    assert sensor.read_raw_shunt() == 1300
+
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\xfa\xec')
+    assert sensor.read_raw_shunt() == -1300
+
+    sensor.close()
+    mock_bus.close.assert_called_once()
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_read_current_reg_scales_by_lsb(mock_smbus):
+    """Tests that the current register is scaled by the calibrated LSB."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\x11\x79')
+    sensor = CurrentSensor(i_max=3.0)
+
+    # Act
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\xff\xfe')
+    amps = sensor.read_current_reg()
+
+    # Assert
+    assert amps == -2 * sensor.current_lsb
+    assert sensor.cal_value_read() == 0x1179
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_calibration_written_msb_first(mock_smbus):
+    """Tests that the calibration register is written MSB-first, then verified."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    writes = []
+
+    def i2c_rdwr(*msgs):
+        writes.append([bytes(m) for m in msgs])
+        msgs[-1].buf[:] = b'\x11\x79'
+    mock_bus.i2c_rdwr.side_effect = i2c_rdwr
+
+    # Act: 0.04096 / (3.0 / 2**15 * 0.1) -> cal = 0x1179
+    sensor = CurrentSensor(address=0x45, r_shunt=0.1, i_max=3.0)
+
+    # Assert: CONFIG (power-on default, 1 sample) first, then calibration
+    assert writes[0] == [b'\x00\x39\x9f']
+    assert writes[1] == [b'\x05\x11\x79']
+    assert writes[2][0] == b'\x05'
+    assert sensor.cal_value_read() == 0x1179
+
+    # The cached value costs no bus traffic until explicitly refreshed
+    assert len(writes) == 3
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\x00\x00')
+    assert sensor.refresh_cal() == 0
+    assert sensor.cal_value_read() == 0
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_read_filtered_low_passes_shunt_counts(mock_smbus):
+    """Tests that the IIR filter is seeded by the first sample and damps single spikes."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    sensor = CurrentSensor(alpha=0.5)
+
+    # Act & Assert: a lone spike only moves the filtered value halfway
+    mock_bus.i2c_rdwr.side_effect = _reply(b'\x00\x00')
+    assert sensor.read_filtered() == 0.0
+    mock_bus.i2c_rdwr.side_effect = _reply((2000).to_bytes(2, 'big'))
+    assert sensor.read_filtered() == 1000.0
+
+    # A sustained level keeps pulling the filtered value towards it
+    assert sensor.read_filtered() == 1500.0
+
+    # After a reset the next sample seeds the filter again
+    sensor.reset_filter()
+    assert sensor.read_filtered() == 2000.0
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_hardware_averaging_sets_sadc_field(mock_smbus):
+    """Tests that avg_samples writes the shunt ADC averaging code into CONFIG."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    writes = []
+
+    def i2c_rdwr(*msgs):
+        writes.append([bytes(m) for m in msgs])
+        msgs[-1].buf[:] = b'\x11\x79'
+    mock_bus.i2c_rdwr.side_effect = i2c_rdwr
+
+    # Act
+    sensor = CurrentSensor(avg_samples=4)
+
+    # Assert: 0x399F with SADC (bits 6..3) = 0b1010 -> 0x39D7
+    assert writes[0] == [b'\x00\x39\xd7']
+    assert writes[1] == [b'\x05\x11\x79']
+    assert abs(sensor.conversion_time - 4 * 532e-6) < 1e-12
+
+
+@patch('hood_sash_automation.actuator.current.smbus2.SMBus')
+def test_hardware_averaging_rejects_unsupported_sample_counts(mock_smbus):
+    """Tests that an avg_samples the INA219 cannot average is refused before touching the bus."""
+    from hood_sash_automation.actuator.current import CurrentSensor
+
+    with pytest.raises(ValueError, match="avg_samples must be one of"):
+        CurrentSensor(avg_samples=3)
+    mock_smbus.assert_not_called()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Tests for the HallArray class from switches.py.
+Tests for the HallArray classes in switches.py (polling) and hall.py (edge-driven).
 """
 
 import os
@@ -41,3 +41,150 @@ def test_hall_array_snapshot(mock_gpio, mock_thread):
     assert states == [1, 1, 0, 1, 1]
     mock_thread.return_value.start.assert_called_once()
     mock_gpio.cleanup.assert_called_once_with(hall_pins)
+
+
+@patch('hood_sash_automation.actuator.switches.threading.Thread')
+@patch('hood_sash_automation.actuator.switches.GPIO')
+def test_hall_array_snapshot_reads_gpio_bank(mock_gpio, mock_thread, tmp_path):
+    """
+    Tests that snapshot() decodes every pin from a single GPLEV0 read when the
+    GPIO registers can be mapped, without calling GPIO.input().
+    """
+    import mmap
+    import struct
+    from hood_sash_automation.actuator.switches import GPIOBank, HallArray
+
+    # Arrange: a fake register page with every pin high except GPIO13.
+    hall_pins = [5, 6, 13, 19, 26]
+    levels = sum(1 << pin for pin in hall_pins) & ~(1 << 13)
+    regs = bytearray(mmap.PAGESIZE)
+    struct.pack_into('<I', regs, GPIOBank.GPLEV0, levels)
+    gpiomem = tmp_path / 'gpiomem'
+    gpiomem.write_bytes(bytes(regs))
+
+    mock_gpio.input.return_value = 1
+    with patch.object(GPIOBank, 'try_open', return_value=GPIOBank(str(gpiomem))):
+        hall = HallArray(hall_pins)
+    mock_gpio.input.reset_mock()
+
+    # Act
+    states = hall.snapshot()
+    hall.close()
+
+    # Assert
+    assert states == [1, 1, 0, 1, 1]
+    mock_gpio.input.assert_not_called()
+
+
+@patch('hood_sash_automation.actuator.switches.threading.Thread')
+@patch('hood_sash_automation.actuator.switches.GPIO')
+def test_hall_array_reads_fall_back_to_gpio_after_close(mock_gpio, mock_thread, tmp_path):
+    """Tests that close() detaches the GPIO bank before unmapping it, so late readers use GPIO.input()."""
+    import mmap
+    from hood_sash_automation.actuator.switches import GPIOBank, HallArray
+
+    hall_pins = [5, 6, 13]
+    gpiomem = tmp_path / 'gpiomem'
+    gpiomem.write_bytes(bytes(mmap.PAGESIZE))
+    bank = GPIOBank(str(gpiomem))
+
+    mock_gpio.input.return_value = 1
+    with patch.object(GPIOBank, 'try_open', return_value=bank):
+        hall = HallArray(hall_pins)
+    hall.close()
+
+    # The mapping is gone, yet a reader arriving after close() does not touch it
+    assert bank._mem.closed
+    assert hall.snapshot_bits() == hall.mask
+    assert hall.snapshot() == [1, 1, 1]
+
+
+@patch('hood_sash_automation.actuator.switches.threading.Thread')
+@patch('hood_sash_automation.actuator.switches.GPIO')
+def test_hall_array_snapshot_bits_packs_levels_by_pin(mock_gpio, mock_thread):
+    """Tests that snapshot_bits() sets bit `pin` for every high pin and nothing else."""
+    from hood_sash_automation.actuator.switches import HallArray
+
+    hall_pins = [5, 6, 13, 19, 26]
+    mock_gpio.input.side_effect = lambda pin: 0 if pin == 13 else 1
+
+    with patch('hood_sash_automation.actuator.switches.GPIOBank.try_open', return_value=None):
+        hall = HallArray(hall_pins)
+    bits = hall.snapshot_bits()
+    hall.close()
+
+    assert bits == hall.mask & ~(1 << 13)
+
+
+@patch('hood_sash_automation.actuator.hall.GPIO')
+def test_edge_hall_array_isr_flips_level_without_reading_pin(mock_gpio):
+    """Tests that the edge-driven HallArray infers the new level from the edge itself."""
+    from unittest.mock import MagicMock
+    from hood_sash_automation.actuator.hall import HallArray
+
+    mock_gpio.input.return_value = 1
+    hall = HallArray([5, 6, 13])
+    callback = MagicMock()
+    hall.set_callback(callback)
+    mock_gpio.input.reset_mock()
+
+    hall._isr(6)
+    assert hall.snapshot() == [1, 0, 1]
+    hall._isr(6)
+    assert hall.snapshot() == [1, 1, 1]
+
+    assert [c.args for c in callback.call_args_list] == [(6, 0, 1), (6, 1, 1)]
+    mock_gpio.input.assert_not_called()
+
+
+@patch('hood_sash_automation.actuator.hall.GPIO')
+def test_edge_hall_array_resyncs_each_pin_on_its_own_edges(mock_gpio):
+    """Tests that a pin left inverted by a lost edge is re-read after RESYNC_EVERY of its own edges."""
+    from hood_sash_automation.actuator.hall import HallArray
+
+    mock_gpio.input.return_value = 1
+    hall = HallArray([5, 6])
+    n = HallArray.RESYNC_EVERY
+
+    # Edges on another pin must not use up pin 6's resync
+    for _ in range(n - 1):
+        hall._isr(5)
+    mock_gpio.input.reset_mock()
+
+    # Pin 6 lost an edge: it really sits at 0 but every inferred flip is
+    # inverted until its own Nth edge reads the pin back.
+    mock_gpio.input.return_value = 0
+    for _ in range(n - 1):
+        hall._isr(6)
+    mock_gpio.input.assert_not_called()
+
+    hall._isr(6)
+    mock_gpio.input.assert_called_once_with(6)
+    assert hall.snapshot()[1] == 0
+
+
+@patch('hood_sash_automation.actuator.hall.GPIO')
+def test_edge_hall_array_snapshot_retries_torn_copy(mock_gpio):
+    """Tests that snapshot() copies again when the ISR ran in the middle of a copy."""
+    from hood_sash_automation.actuator.hall import HallArray
+
+    mock_gpio.input.return_value = 1
+    hall = HallArray([5, 6])
+    state = hall.state
+    copies = []
+
+    class RacingState:
+        def tolist(self):
+            copies.append(None)
+            if len(copies) == 1:
+                # The ISR stores a new level mid-copy
+                state[0] = 0
+                hall._ver += 1
+                return [1, 1]
+            return state.tolist()
+    hall.state = RacingState()
+    snap = hall.snapshot()
+    hall.state = state
+
+    assert snap == [0, 1]
+    assert len(copies) == 2
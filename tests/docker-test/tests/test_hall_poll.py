@@ -60,3 +60,53 @@ def test_hall_poll_once_detects_changed_pin(mock_gpio, mock_thread):
     assert hall.snapshot() == [1, 1, 0, 1, 1]
     mock_thread.return_value.start.assert_called_once()
     hall.close()
+
+
+@patch('hood_sash_automation.actuator.switches.threading.Thread')
+@patch('hood_sash_automation.actuator.switches.GPIO')
+def test_hall_edges_are_queued_with_sample_time(mock_gpio, mock_thread):
+    """Tests that accepted edges are queued with the polling pass timestamp."""
+    from hood_sash_automation.actuator.switches import HallArray
+
+    hall_pins = [5, 6, 13]
+    states = {pin: 1 for pin in hall_pins}
+    mock_gpio.input.side_effect = lambda pin: states[pin]
+    hall = HallArray(hall_pins, bouncetime=10)
+
+    states[6] = 0
+    states[13] = 0
+    with patch('hood_sash_automation.actuator.switches.time.monotonic', return_value=42.0):
+        hall._poll_once()
+
+    assert hall.pop_events() == [(1, 0, 42.0), (2, 0, 42.0)]
+    assert hall.pop_events() == []
+    hall.close()
+
+
+@patch('hood_sash_automation.actuator.switches.threading.Thread')
+@patch('hood_sash_automation.actuator.switches.GPIO')
+def test_hall_poll_once_reads_gpio_bank_once(mock_gpio, mock_thread):
+    """Tests that a polling pass decodes every pin from one bank read when the bank is mapped."""
+    from hood_sash_automation.actuator.switches import GPIOBank, HallArray
+
+    hall_pins = [5, 6, 13]
+    callback_func = MagicMock()
+    bank = MagicMock(spec=GPIOBank)
+    bank.levels.return_value = sum(1 << pin for pin in hall_pins)
+
+    mock_gpio.input.return_value = 1
+    with patch.object(GPIOBank, 'try_open', return_value=bank):
+        hall = HallArray(hall_pins, bouncetime=10)
+    hall.set_callback(callback_func)
+    mock_gpio.input.reset_mock()
+
+    hall._poll_once()  # unchanged levels: nothing to do
+    callback_func.assert_not_called()
+
+    bank.levels.return_value &= ~(1 << 6)
+    hall._poll_once()
+
+    callback_func.assert_called_once_with(6, 0, 1)
+    assert bank.levels.call_count == 2
+    mock_gpio.input.assert_not_called()
+    hall.close()
@@ -3,6 +3,8 @@ import pytest
 import os
 from unittest.mock import patch, MagicMock
 
+from conftest import pack_bits
+
 # Sample config for integration testing
 INTEGRATION_CONFIG = {
     'HALL_PINS': [5, 6, 13, 19, 26], 'BOUNCE_MS': 10, 'RELAY_EXT': 27, 'RELAY_RET': 17,
@@ -11,6 +13,8 @@ INTEGRATION_CONFIG = {
     'MAX_MOVEMENT_TIME': 10.0, 'POSITION_TIMEOUT': 2.0,
     'POSITION_STATE_FILE': "/tmp/test_pos", 'LOG_DIR': "/tmp/test_log"
 }
+HALL_PINS = INTEGRATION_CONFIG['HALL_PINS']
+
 
 @pytest.fixture
 def minimal_hardware_mock(mocker):
@@ -32,7 +36,9 @@ def minimal_hardware_mock(mocker):
     # Mock current sensor I2C operations only
     mock_smbus = mocker.patch('hood_sash_automation.actuator.current.smbus2.SMBus')
     mock_smbus_instance = MagicMock()
-    mock_smbus_instance.read_i2c_block_data.return_value = [0x11, 0x79]  # Return valid calibration
+    def i2c_rdwr(*msgs):
+        msgs[-1].buf[:] = b'\x11\x79'  # Return valid calibration
+    mock_smbus_instance.i2c_rdwr.side_effect = i2c_rdwr
     mock_smbus.return_value = mock_smbus_instance
 
     # Mock LCD display only
@@ -68,23 +74,65 @@ class TestActuatorIntegration:
         assert mock_gpio.setup.called
         assert mock_gpio.setmode.called
 
-    def test_position_state_persistence(self, minimal_hardware_mock):
-        """Test that position state is properly saved and loaded."""
+    def test_position_state_persistence(self, minimal_hardware_mock, tmp_path):
+        """Test that position state is written atomically, off-thread and only when it changes."""
         mock_gpio, mock_open = minimal_hardware_mock
 
         from hood_sash_automation.actuator.controller import SashActuator
 
+        state_file = tmp_path / 'position_state'
+        config = {**INTEGRATION_CONFIG, 'POSITION_STATE_FILE': str(state_file)}
         with patch.object(SashActuator, 'home_on_startup'):
-            actuator = SashActuator(INTEGRATION_CONFIG)
+            actuator = SashActuator(config)
 
         # Test position state writing (method takes no position parameter)
         actuator.current_position = 3
         actuator._write_position_state()
+        actuator._state_queue.join()
+
+        # Verify the state landed in place and no temp file was left behind
+        assert state_file.read_bytes() == b'3'
+        assert not (tmp_path / 'position_state.tmp').exists()
+
+        # A shorter value replaces a longer one without leftover bytes
+        actuator.current_position = None
+        actuator._write_position_state()
+        actuator._state_queue.join()
+        assert state_file.read_bytes() == b'None'
+        actuator.current_position = 3
+        actuator._write_position_state()
+        actuator._state_queue.join()
+        assert state_file.read_bytes() == b'3'
+
+        # An unchanged position is not rewritten
+        state_file.write_bytes(b'x')
+        actuator._write_position_state()
+        actuator._state_queue.join()
+        assert state_file.read_bytes() == b'x'
+
+    def test_position_state_flushed_before_shutdown_sentinel(self, minimal_hardware_mock, tmp_path):
+        """Test that a position queued right before the shutdown sentinel is still written."""
+        mock_gpio, mock_open = minimal_hardware_mock
+
+        from hood_sash_automation.actuator.controller import SashActuator
+
+        state_file = tmp_path / 'position_state'
+        config = {**INTEGRATION_CONFIG, 'POSITION_STATE_FILE': str(state_file)}
+        with patch.object(SashActuator, 'home_on_startup'):
+            actuator = SashActuator(config)
+        actuator.current_position = 1
+        actuator._write_position_state()
+        actuator._state_queue.join()
+
+        # Stop the background writer, then drain a queue holding a position
+        # and the sentinel in one pass, as clean_exit leaves it
+        actuator._state_queue.put(None)
+        actuator._state_thread.join(timeout=1)
+        actuator._state_queue.put('4')
+        actuator._state_queue.put(None)
+        actuator._state_writer()
 
-        # Verify file was opened for writing
-        mock_open.assert_called_with(INTEGRATION_CONFIG['POSITION_STATE_FILE'], 'w')
-        handle = mock_open.return_value
-        handle.write.assert_called_with('3')
+        assert state_file.read_bytes() == b'4'
 
     def test_hall_sensor_position_detection(self, minimal_hardware_mock):
         """Test position detection logic works correctly."""
@@ -98,18 +146,18 @@ class TestActuatorIntegration:
         # Test the position detection logic by directly testing the method
         # Since GPIO mocking is complex, test the logic directly
 
-        # Mock the hall.snapshot method to return specific states
-        with patch.object(actuator.hall, 'snapshot', return_value=[1, 1, 0, 1, 1]):
+        # Mock the hall.snapshot_bits method to return specific states
+        with patch.object(actuator.hall, 'snapshot_bits', return_value=pack_bits([1, 1, 0, 1, 1], HALL_PINS)):
             position = actuator.get_current_position()
             assert position == 3  # Should detect position 3 (index 2 + 1)
 
         # Test another position
-        with patch.object(actuator.hall, 'snapshot', return_value=[0, 1, 1, 1, 1]):
+        with patch.object(actuator.hall, 'snapshot_bits', return_value=pack_bits([0, 1, 1, 1, 1], HALL_PINS)):
             position = actuator.get_current_position()
             assert position == 1  # Should detect position 1 (index 0 + 1)
 
         # Test no position detected
-        with patch.object(actuator.hall, 'snapshot', return_value=[1, 1, 1, 1, 1]):
+        with patch.object(actuator.hall, 'snapshot_bits', return_value=pack_bits([1, 1, 1, 1, 1], HALL_PINS)):
             position = actuator.get_current_position()
             assert position is None  # No sensors active
 
@@ -180,7 +228,7 @@ class TestAPIIntegration:
             }
             mock_actuator_class.return_value = mock_instance
 
-            with patch('yaml.safe_load', return_value=mock_config):
+            with patch('yaml.load', return_value=mock_config):
                 from hood_sash_automation.api.api_service import create_app
                 app = create_app()
 
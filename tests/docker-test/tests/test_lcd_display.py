@@ -0,0 +1,45 @@
+# tests/test_lcd_display.py
+from unittest.mock import patch
+
+
+@patch('hood_sash_automation.actuator.lcd_display_DFR0997.smbus2.SMBus')
+def test_background_img_is_one_raw_write(mock_smbus):
+    """
+    Tests that a command longer than an SMBus block goes out as a single
+    I2C write: register byte, header, length, opcode, then the parameters.
+    """
+    from hood_sash_automation.actuator.lcd_display_DFR0997 import DFRobotLCD
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    lcd = DFRobotLCD()
+    path = "/home/pi/sash/images/position3.png"
+
+    # Act
+    lcd.set_background_img(1, path)
+
+    # Assert
+    (msg,), _ = mock_bus.i2c_rdwr.call_args
+    expected = bytes([0x00, 0x55, 0xAA, 2 + len(path), 0x1A, 1]) + path.encode()
+    assert bytes(msg) == expected
+    assert len(expected) > 32
+
+
+@patch('hood_sash_automation.actuator.lcd_display_DFR0997.smbus2.SMBus')
+def test_background_img_skips_redraw_until_screen_changes(mock_smbus):
+    """Tests that re-showing the on-screen image is skipped until another command draws."""
+    from hood_sash_automation.actuator.lcd_display_DFR0997 import DFRobotLCD
+
+    # Arrange
+    mock_bus = mock_smbus.return_value
+    lcd = DFRobotLCD()
+    path = "/home/pi/sash/images/position1.png"
+
+    # Act & Assert
+    lcd.set_background_img(1, path)
+    lcd.set_background_img(1, path)
+    assert mock_bus.i2c_rdwr.call_count == 1
+
+    lcd.clean_screen()
+    lcd.set_background_img(1, path)
+    assert mock_bus.i2c_rdwr.call_count == 3
@@ -0,0 +1,79 @@
+# tests/test_sensor.py
+"""Tests for the edge-driven SashSensor."""
+from unittest.mock import patch
+
+from conftest import wait_for
+
+HALL_PIN = 23
+LED_PIN = 24
+
+
+def test_edge_updates_state_and_led(gpio_pins):
+    """Tests that a Hall edge updates the state, drives the LED and notifies the listener."""
+    from hood_sash_automation.sensor.sensor import SashSensor
+
+    gpio = gpio_pins(HALL_PIN, LED_PIN)
+
+    sensor = SashSensor(HALL_PIN, LED_PIN, resync_interval=60)
+    changes = []
+    sensor.on_state_change = changes.append
+    sensor.start()
+    assert wait_for(lambda: gpio.get_pin_state(HALL_PIN)['event'] is not None)
+
+    # The mock pin starts low (magnet present); each set fires the edge callback
+    gpio.set_pin_value(HALL_PIN, gpio.HIGH)
+    assert sensor.get_current_state() is False
+    assert gpio.get_pin_state(LED_PIN)['value'] == gpio.LOW
+
+    gpio.set_pin_value(HALL_PIN, gpio.LOW)
+    assert sensor.get_current_state() is True
+    assert gpio.get_pin_state(LED_PIN)['value'] == gpio.HIGH
+    assert changes == [False, True]
+    sensor.cleanup()
+
+
+def test_resync_catches_a_swallowed_edge(gpio_pins):
+    """Tests that the periodic re-read picks up a level change that raised no edge."""
+    from hood_sash_automation.sensor.sensor import SashSensor
+
+    gpio = gpio_pins(HALL_PIN, LED_PIN)
+
+    sensor = SashSensor(HALL_PIN, LED_PIN, resync_interval=0.01)
+    sensor.start()
+    assert sensor.get_current_state() is True
+    gpio.get_pin_state(HALL_PIN)['value'] = gpio.HIGH  # no callback fired
+
+    assert wait_for(lambda: sensor.get_current_state() is False)
+    sensor.cleanup()
+
+
+def test_cleanup_stops_callbacks_before_releasing_pins(gpio_pins):
+    """Tests that cleanup removes edge detection and joins the resync thread before GPIO.cleanup."""
+    from hood_sash_automation.sensor.sensor import SashSensor
+
+    gpio = gpio_pins(HALL_PIN, LED_PIN)
+
+    sensor = SashSensor(HALL_PIN, LED_PIN, resync_interval=60)
+    sensor.start()
+    assert wait_for(lambda: gpio.get_pin_state(HALL_PIN)['event'] is not None)
+    order = []
+    remove_event_detect, cleanup = gpio.remove_event_detect, gpio.cleanup
+
+    def record_remove(channel):
+        order.append(('remove_event_detect', sensor.is_alive()))
+        remove_event_detect(channel)
+
+    def record_cleanup(channels):
+        order.append(('cleanup', sensor.is_alive()))
+        cleanup(channels)
+
+    with patch.object(gpio, 'remove_event_detect', side_effect=record_remove), \
+            patch.object(gpio, 'cleanup', side_effect=record_cleanup):
+        sensor.cleanup()
+
+    assert order == [('remove_event_detect', False), ('cleanup', False)]
+    assert gpio.get_pin_state(HALL_PIN) is None
+    assert gpio.get_pin_state(LED_PIN) is None
+    # A callback already in flight must not touch the released LED pin
+    sensor._update(False)
+    assert sensor.get_current_state() is True